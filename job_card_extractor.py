@@ -19,14 +19,17 @@ import re
 import argparse
 import sys
 from pathlib import Path
-from pdf2image import convert_from_path
-import easyocr
+from pdf2image import convert_from_path, pdfinfo_from_path
 from PIL import Image
 import warnings
 from pyzbar.pyzbar import decode
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import hashlib
 from functools import lru_cache
+from bisect import bisect_right
+from itertools import accumulate
+import queue
+import threading
 import time
 from typing import List, Dict, Tuple, Optional
 import logging
@@ -306,80 +309,95 @@ def display_version():
 # Barcode and OCR Extraction Functions
 #############################################
 
+# Deletion table for every non-alphanumeric ASCII character
+_ASCII_NON_ALNUM = str.maketrans('', '', ''.join(chr(i) for i in range(128) if not chr(i).isalnum()))
+# Runs of non-alphanumeric characters in any script (\w is str.isalnum() plus '_')
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
 def clean_barcode_value(s):
     """Remove all control and non-alphanumeric characters."""
-    return ''.join(c for c in s if c.isalnum())
+    if s.isascii():
+        return s.translate(_ASCII_NON_ALNUM)
+    return _NON_ALNUM_RE.sub('', s)
+
+# Horizontal separators survive heavy downsampling, so line detection runs on a
+# reduced copy of the page; morphology and thresholding cost scale with pixel count
+_LINE_DETECTION_SCALE = 4
 
 def detect_horizontal_lines(img_cv):
-    """Detect horizontal lines in the image."""
-    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    """Detect horizontal lines in the image (BGR or already grayscale)."""
+    height, width = img_cv.shape[:2]
+    scale = _LINE_DETECTION_SCALE
+    small = cv2.resize(img_cv, (max(1, width // scale), max(1, height // scale)),
+                       interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
     # Adaptive thresholding for better binarization
-    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 35, 15)
-    # Morphological kernel: wide and thin for horizontal lines
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (img_cv.shape[1] // 5, 2))
-    detect_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=2)
-    # Find contours of the lines
-    contours, _ = cv2.findContours(detect_lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 9, 15)
+    # Keep horizontal segments with a short kernel, then bridge small gaps
+    # along each line; text rows never chain into page-wide components
+    segment_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (10, 1))
+    segments = cv2.morphologyEx(binary, cv2.MORPH_OPEN, segment_kernel, iterations=1)
+    bridge_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(1, width // (20 * scale)), 1))
+    detect_lines = cv2.dilate(segments, bridge_kernel)
+    # Bounding boxes of the line components, as one (N, 5) stats array (row 0 is background)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(detect_lines, connectivity=8)
+    line_stats = stats[1:]
 
     # Filter lines by length (must be at least 60% of image width)
-    min_line_length = int(img_cv.shape[1] * 0.6)
-    lines_y = []
-    for cnt in contours:
-        x, y, w, h = cv2.boundingRect(cnt)
-        if w >= min_line_length:
-            lines_y.append(y)
-
-    # Add top and bottom of the page
-    lines_y = [0] + sorted(lines_y) + [img_cv.shape[0]]
-    # Remove duplicates and sort
-    return sorted(list(set(lines_y)))
+    min_line_length = int(width * 0.6) // scale
+    long_lines = line_stats[line_stats[:, cv2.CC_STAT_WIDTH] >= min_line_length]
+    # Map each line's vertical centre back to page coordinates; its top row would
+    # land up to a scale step above the real rule
+    lines_y = long_lines[:, cv2.CC_STAT_TOP] * scale + long_lines[:, cv2.CC_STAT_HEIGHT] * scale // 2
 
-def detect_barcodes(img_crop, enhance_detection=True):
-    """Enhanced barcode detection with multiple preprocessing strategies."""
-    if img_crop is None or img_crop.size == 0:
-        return [], []
-        
-    result = []
+    # Add top and bottom of the page, remove duplicates and sort
+    return np.unique(np.concatenate(([0], lines_y, [height]))).tolist()
+
+def _decode_enhanced(img_crop):
+    """
+    Retry barcode decoding on a crop with contrast and threshold enhancements.
+
+    Returns:
+        list: Raw pyzbar results, in crop coordinates
+    """
     all_barcodes = []
+
+    # Strategy 2: Try with grayscale conversion (colour crops only)
+    gray = img_crop
+    if len(img_crop.shape) == 3:
+        gray = cv2.cvtColor(img_crop, cv2.COLOR_BGR2GRAY)
+        barcodes_gray = decode(Image.fromarray(gray))
+        all_barcodes.extend(barcodes_gray)
     
-    # Convert to PIL Image if needed
-    if isinstance(img_crop, np.ndarray):
-        pil_image = Image.fromarray(img_crop)
-    else:
-        pil_image = img_crop
-    
-    # Strategy 1: Direct detection on original image
-    barcodes = decode(pil_image)
-    all_barcodes.extend(barcodes)
-    
-    if enhance_detection and len(barcodes) == 0:
-        # Strategy 2: Try with grayscale conversion
-        if len(img_crop.shape) == 3:
-            gray = cv2.cvtColor(img_crop, cv2.COLOR_BGR2GRAY)
-            barcodes_gray = decode(Image.fromarray(gray))
-            all_barcodes.extend(barcodes_gray)
+    # Strategy 3: Try with enhanced contrast
+    try:
+        # Apply CLAHE for better contrast
+        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
+        enhanced = clahe.apply(gray)
         
-        # Strategy 3: Try with enhanced contrast
-        try:
-            if len(img_crop.shape) == 3:
-                gray = cv2.cvtColor(img_crop, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = img_crop.copy()
-                
-            # Apply CLAHE for better contrast
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-            enhanced = clahe.apply(gray)
+        # Try different thresholding methods
+        for thresh_type in [cv2.THRESH_BINARY, cv2.THRESH_BINARY_INV]:
+            _, binary = cv2.threshold(enhanced, 0, 255, thresh_type + cv2.THRESH_OTSU)
+            barcodes_thresh = decode(Image.fromarray(binary))
+            all_barcodes.extend(barcodes_thresh)
             
-            # Try different thresholding methods
-            for thresh_type in [cv2.THRESH_BINARY, cv2.THRESH_BINARY_INV]:
-                _, binary = cv2.threshold(enhanced, 0, 255, thresh_type + cv2.THRESH_OTSU)
-                barcodes_thresh = decode(Image.fromarray(binary))
-                all_barcodes.extend(barcodes_thresh)
-                
-        except Exception as e:
-            print(f"Warning: Error in enhanced barcode detection: {e}")
-    
-    # Remove duplicates and process results
+    except Exception as e:
+        print(f"Warning: Error in enhanced barcode detection: {e}")
+
+    return all_barcodes
+
+def _barcode_records(all_barcodes, y_shift=0):
+    """
+    Turn raw pyzbar results into cleaned, de-duplicated barcode dicts.
+
+    Args:
+        all_barcodes (list): Raw pyzbar results
+        y_shift (int): Offset subtracted from each rect's top, to make rects area-relative
+
+    Returns:
+        list: Barcode dicts with type, barcode, rect and confidence
+    """
+    result = []
     seen_barcodes = set()
     for barcode in all_barcodes:
         try:
@@ -389,38 +407,70 @@ def detect_barcodes(img_crop, enhance_detection=True):
             # Avoid duplicates
             if cleaned_barcode not in seen_barcodes and cleaned_barcode:
                 seen_barcodes.add(cleaned_barcode)
+                x, y, w, h = barcode.rect
                 result.append({
                     'type': barcode.type,
-                    'barcode': cleaned_barcode,
-                    'rect': list(barcode.rect),
+                    'barcode': sys.intern(cleaned_barcode),  # The same job barcode repeats across pages
+                    'rect': [x, y - y_shift, w, h],
                     'confidence': getattr(barcode, 'quality', 100)  # Some barcode libraries provide quality
                 })
         except Exception as e:
             print(f"Warning: Error processing barcode: {e}")
             continue
+    return result
+
+def detect_barcodes(img_crop, enhance_detection=True):
+    """
+    Enhanced barcode detection with multiple preprocessing strategies.
+
+    Grayscale crops are preferred: pyzbar only reads luminance, so a BGR crop
+    would be converted to grayscale again on every decode attempt.
+    """
+    if img_crop is None or img_crop.size == 0:
+        return [], []
     
-    return result, all_barcodes
+    # Convert to PIL Image if needed
+    if isinstance(img_crop, np.ndarray):
+        pil_image = Image.fromarray(img_crop)
+    else:
+        pil_image = img_crop
+    
+    # Strategy 1: Direct detection on original image
+    all_barcodes = list(decode(pil_image))
+    
+    if enhance_detection and len(all_barcodes) == 0:
+        all_barcodes.extend(_decode_enhanced(img_crop))
+    
+    # Remove duplicates and process results
+    return _barcode_records(all_barcodes), all_barcodes
+
+# Crops shorter than this are upscaled before OCR, by at most _OCR_MAX_UPSCALE
+_OCR_MIN_HEIGHT = 300
+_OCR_MAX_UPSCALE = 2.0
 
 def preprocess_image_for_ocr(crop, enhance_quality=True, logger=None, operation_number=None, area_index=None):
-    """Enhanced preprocessing for better OCR results with multiple quality levels."""
+    """Enhanced preprocessing for better OCR results; returns a single-channel image."""
     if crop is None or crop.size == 0:
         return None
         
     preprocessing_steps = []
     
     try:
-        # 1. Enhanced denoising with bilateral filter for better edge preservation
-        crop_denoised = cv2.bilateralFilter(crop, 9, 75, 75)
-        preprocessing_steps.append("Applied bilateral filter for denoising")
-        
-        # 2. Convert to grayscale early for better processing
-        if len(crop_denoised.shape) == 3:
-            crop_gray = cv2.cvtColor(crop_denoised, cv2.COLOR_BGR2GRAY)
+        # 1. Convert to grayscale first so denoising runs on a single channel
+        if len(crop.shape) == 3:
+            crop_gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
             preprocessing_steps.append("Converted to grayscale")
         else:
-            crop_gray = crop_denoised.copy()
+            crop_gray = crop
             preprocessing_steps.append("Image already in grayscale")
         
+        # 2. Light edge-preserving denoising (skipped in fast mode)
+        if enhance_quality:
+            crop_gray = cv2.bilateralFilter(crop_gray, 5, 40, 40)
+            preprocessing_steps.append("Applied bilateral filter for denoising")
+        else:
+            preprocessing_steps.append("Skipped denoising (fast mode)")
+        
         # 3. Contrast enhancement using CLAHE
         clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
         crop_enhanced = clahe.apply(crop_gray)
@@ -431,44 +481,34 @@ def preprocess_image_for_ocr(crop, enhance_quality=True, logger=None, operation_
             gaussian = cv2.GaussianBlur(crop_enhanced, (0, 0), 2.0)
             crop_sharpened = cv2.addWeighted(crop_enhanced, 1.5, gaussian, -0.5, 0)
             preprocessing_steps.append("Applied unsharp mask sharpening")
-            
-            # 5. Morphological operations to clean up text
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 1))
-            crop_morph = cv2.morphologyEx(crop_sharpened, cv2.MORPH_CLOSE, kernel)
-            preprocessing_steps.append("Applied morphological closing")
         else:
-            crop_morph = crop_enhanced
+            crop_sharpened = crop_enhanced
             preprocessing_steps.append("Skipped advanced sharpening (fast mode)")
         
-        # 6. Adaptive thresholding with optimized parameters
+        # 5. Adaptive thresholding with optimized parameters
         crop_bin = cv2.adaptiveThreshold(
-            crop_morph, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+            crop_sharpened, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
             cv2.THRESH_BINARY, 15, 10
         )
         preprocessing_steps.append("Applied adaptive thresholding")
         
-        # 7. Intelligent upscaling based on text density
-        min_height = 400 if enhance_quality else 300
-        if crop_bin.shape[0] < min_height:
-            scale = min_height / crop_bin.shape[0]
-            # Use INTER_LANCZOS4 for better text quality
+        # 6. Upscale only short crops; EasyOCR rescales to its model input anyway
+        if crop_bin.shape[0] < _OCR_MIN_HEIGHT:
+            scale = min(_OCR_MIN_HEIGHT / crop_bin.shape[0], _OCR_MAX_UPSCALE)
             crop_bin = cv2.resize(
                 crop_bin, None, fx=scale, fy=scale, 
-                interpolation=cv2.INTER_LANCZOS4
+                interpolation=cv2.INTER_LINEAR
             )
             preprocessing_steps.append(f"Upscaled image by {scale:.2f}x to {crop_bin.shape[1]}x{crop_bin.shape[0]}")
         else:
             preprocessing_steps.append("No upscaling needed")
         
-        # 8. Convert back to 3 channels for EasyOCR
-        result = cv2.cvtColor(crop_bin, cv2.COLOR_GRAY2RGB)
-        preprocessing_steps.append("Converted to RGB for OCR")
-        
         # Log preprocessing steps if logger is provided
         if logger and operation_number and area_index is not None:
             logger.log_image_preprocessing(operation_number, area_index, preprocessing_steps)
         
-        return result
+        # EasyOCR accepts single-channel input, so the result stays grayscale
+        return crop_bin
         
     except Exception as e:
         error_msg = f"Warning: Error in image preprocessing: {e}"
@@ -483,10 +523,8 @@ def preprocess_image_for_ocr(crop, enhance_quality=True, logger=None, operation_
         
         # Fallback to basic processing
         if len(crop.shape) == 3:
-            crop_gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
-        else:
-            crop_gray = crop.copy()
-        return cv2.cvtColor(crop_gray, cv2.COLOR_GRAY2RGB)
+            return cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+        return crop.copy()
 
 @lru_cache(maxsize=128)
 def _cached_ocr_hash(image_hash: str, reader_id: str) -> str:
@@ -496,6 +534,66 @@ def _cached_ocr_hash(image_hash: str, reader_id: str) -> str:
 # Global cache for OCR results
 _ocr_cache = {}
 
+# Global cache for EasyOCR readers, keyed by language set
+_READER_CACHE = {}
+_READER_CACHE_LOCK = threading.Lock()
+
+def _get_reader(lang_list):
+    """Return a shared EasyOCR reader for the given languages, creating it on first use."""
+    key = tuple(sorted(lang_list))
+    with _READER_CACHE_LOCK:
+        reader = _READER_CACHE.get(key)
+        if reader is None:
+            # Imported on first use: EasyOCR loads torch, which takes seconds and is not
+            # needed by the text-only extraction functions
+            import easyocr
+            reader = easyocr.Reader(list(lang_list))
+            _READER_CACHE[key] = reader
+    return reader
+
+def _ocr_cache_key(reader, image):
+    """Build the OCR cache key for an image and reader."""
+    image_bytes = cv2.imencode('.jpg', image)[1].tobytes()
+    image_hash = hashlib.md5(image_bytes).hexdigest()
+    reader_id = str(id(reader))  # Simple reader identification
+    return f"{image_hash}_{reader_id}"
+
+def _store_ocr_result(cache_key, result):
+    """Store an OCR result in the global cache, evicting the oldest entries when full."""
+    _ocr_cache[cache_key] = result
+    # Limit cache size
+    if len(_ocr_cache) > 200:
+        # Remove oldest entries (simple FIFO)
+        oldest_keys = list(_ocr_cache.keys())[:50]
+        for key in oldest_keys:
+            del _ocr_cache[key]
+
+# OCR often reads spaces as underscores
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+def _filter_ocr_result(ocr_result):
+    """Keep confident, non-trivial OCR lines. Returns (lines, confidence_scores)."""
+    filtered_lines = []
+    confidence_scores = []
+    for (bbox, text, confidence) in ocr_result:
+        # Only include text with reasonable confidence (>0.3)
+        if confidence <= 0.3:
+            continue
+        # Strip once; mapping underscores afterwards cannot empty the text
+        cleaned_text = text.strip()
+        if not cleaned_text:
+            continue
+        cleaned_text = cleaned_text.translate(_UNDERSCORE_TO_SPACE)
+        # Remove obvious OCR artifacts
+        if len(cleaned_text) > 1 or cleaned_text.isalnum():
+            filtered_lines.append(cleaned_text)
+            confidence_scores.append(confidence)
+    return filtered_lines, confidence_scores
+
+# Pixel budget for one batched OCR call. EasyOCR's detector runs the whole batch in one
+# forward pass, so its memory grows with the summed size of the crops.
+_OCR_BATCH_MAX_PIXELS = 2_000_000
+
 def perform_ocr(reader, image, use_cache=True, logger=None, operation_number=None, area_index=None):
     """Enhanced OCR with caching and confidence scoring."""
     if image is None:
@@ -504,10 +602,7 @@ def perform_ocr(reader, image, use_cache=True, logger=None, operation_number=Non
     try:
         # Generate hash for caching
         if use_cache:
-            image_bytes = cv2.imencode('.jpg', image)[1].tobytes()
-            image_hash = hashlib.md5(image_bytes).hexdigest()
-            reader_id = str(id(reader))  # Simple reader identification
-            cache_key = f"{image_hash}_{reader_id}"
+            cache_key = _ocr_cache_key(reader, image)
             
             if cache_key in _ocr_cache:
                 if logger and operation_number:
@@ -518,17 +613,7 @@ def perform_ocr(reader, image, use_cache=True, logger=None, operation_number=Non
         ocr_result = reader.readtext(image, detail=True, paragraph=False)
         
         # Filter results by confidence and clean text
-        filtered_lines = []
-        confidence_scores = []
-        for (bbox, text, confidence) in ocr_result:
-            # Only include text with reasonable confidence (>0.3)
-            if confidence > 0.3 and text.strip():
-                cleaned_text = text.strip().replace('_', ' ')
-                # Remove obvious OCR artifacts
-                if len(cleaned_text) > 1 or cleaned_text.isalnum():
-                    filtered_lines.append(cleaned_text)
-                    confidence_scores.append(confidence)
-        
+        filtered_lines, confidence_scores = _filter_ocr_result(ocr_result)
         result = "\n".join(filtered_lines)
         
         # Log OCR results if logger is provided
@@ -539,13 +624,7 @@ def perform_ocr(reader, image, use_cache=True, logger=None, operation_number=Non
         
         # Cache the result
         if use_cache:
-            _ocr_cache[cache_key] = result
-            # Limit cache size
-            if len(_ocr_cache) > 200:
-                # Remove oldest entries (simple FIFO)
-                oldest_keys = list(_ocr_cache.keys())[:50]
-                for key in oldest_keys:
-                    del _ocr_cache[key]
+            _store_ocr_result(cache_key, result)
         
         return result
         
@@ -556,6 +635,86 @@ def perform_ocr(reader, image, use_cache=True, logger=None, operation_number=Non
             logger.log_operation(operation_number, "error", error_msg)
         return ""
 
+def perform_ocr_batch(reader, images, use_cache=True):
+    """
+    OCR several images, batching those that share a shape.
+
+    Cached images are answered from the cache. The rest are grouped by exact shape
+    (so nothing is padded) and each group is sent through reader.readtext_batched in
+    calls of at most _OCR_BATCH_MAX_PIXELS pixels; an image alone in its call uses
+    reader.readtext. Falls back to per-image OCR if a batched call fails.
+
+    Args:
+        reader (easyocr.Reader): OCR reader to use
+        images (list): Preprocessed images (entries may be None)
+        use_cache (bool): Whether to use the OCR result cache
+
+    Returns:
+        list: One OCR text per input image ("" for None entries)
+    """
+    results = [""] * len(images)
+    groups = {}  # image shape -> [(image index, cache key)]
+
+    for i, image in enumerate(images):
+        if image is None:
+            continue
+        try:
+            cache_key = _ocr_cache_key(reader, image) if use_cache else None
+        except Exception:
+            # Unencodable image: perform_ocr reports the error and returns ""
+            results[i] = perform_ocr(reader, image, use_cache=use_cache)
+            continue
+        if cache_key is not None and cache_key in _ocr_cache:
+            results[i] = _ocr_cache[cache_key]
+        else:
+            groups.setdefault(image.shape, []).append((i, cache_key))
+
+    for shape, members in groups.items():
+        per_call = max(1, _OCR_BATCH_MAX_PIXELS // (shape[0] * shape[1]))
+        for start in range(0, len(members), per_call):
+            chunk = members[start:start + per_call]
+            try:
+                if len(chunk) == 1:
+                    chunk_results = [reader.readtext(images[chunk[0][0]], detail=True, paragraph=False)]
+                else:
+                    chunk_results = reader.readtext_batched([images[i] for i, _ in chunk], batch_size=len(chunk),
+                                                            detail=True, paragraph=False)
+            except Exception as e:
+                if len(chunk) == 1:
+                    print(f"Warning: Error in OCR processing: {e}")
+                    continue
+                print(f"Warning: Batched OCR failed, falling back to per-area OCR: {e}")
+                for i, _ in chunk:
+                    results[i] = perform_ocr(reader, images[i], use_cache=use_cache)
+                continue
+
+            for (i, cache_key), ocr_result in zip(chunk, chunk_results):
+                filtered_lines, _ = _filter_ocr_result(ocr_result)
+                results[i] = "\n".join(filtered_lines)
+                if cache_key is not None:
+                    _store_ocr_result(cache_key, results[i])
+
+    return results
+
+def _draw_rectangle(img, pt1, pt2, color, thickness=2):
+    """Draw an axis-aligned rectangle outline by assigning its four edges as array slices.
+
+    Edges are drawn inside the corners and clipped to the image; edges lying outside
+    the image are skipped.
+    """
+    h, w = img.shape[:2]
+    (x1, y1), (x2, y2) = pt1, pt2
+    rows = slice(max(y1, 0), max(min(y2 + 1, h), 0))
+    cols = slice(max(x1, 0), max(min(x2 + 1, w), 0))
+    if 0 <= y1 < h:
+        img[y1:y1 + thickness, cols] = color
+    if 0 <= y2 < h:
+        img[max(y2 - thickness + 1, 0):y2 + 1, cols] = color
+    if 0 <= x1 < w:
+        img[rows, x1:x1 + thickness] = color
+    if 0 <= x2 < w:
+        img[rows, max(x2 - thickness + 1, 0):x2 + 1] = color
+
 def create_debug_image(img_cv, lines_y, barcode_annots, ocr_annots):
     """Create a debug image with visual annotations."""
     debug_img = img_cv.copy()
@@ -564,11 +723,11 @@ def create_debug_image(img_cv, lines_y, barcode_annots, ocr_annots):
         y1, y2 = lines_y[i], lines_y[i + 1]
         if y2 - y1 < 50:
             continue
-        cv2.rectangle(debug_img, (0, y1), (img_cv.shape[1]-1, y2-1), (0, 0, 255), 2)
+        _draw_rectangle(debug_img, (0, y1), (img_cv.shape[1]-1, y2-1), (0, 0, 255), 2)
 
     # Draw barcodes (green) and values
     for (x, y, w, h), value in barcode_annots:
-        cv2.rectangle(debug_img, (x, y), (x+w, y+h), (0, 255, 0), 2)
+        _draw_rectangle(debug_img, (x, y), (x+w, y+h), (0, 255, 0), 2)
         cv2.putText(debug_img, value, (x, max(y-10,0)), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 200, 0), 2, cv2.LINE_AA)
 
     # Draw OCR text (blue) for each area
@@ -578,81 +737,321 @@ def create_debug_image(img_cv, lines_y, barcode_annots, ocr_annots):
 
     return debug_img
 
-def process_page(page_num, img, reader, create_debug=True, enhance_quality=True):
-    """Optimized page processing with reduced redundancy."""
-    start_time = time.time()
-    
-    try:
-        img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        lines_y = detect_horizontal_lines(img_cv)
-        print(f"Page {page_num+1}: Detected {len(lines_y)-2} areas between horizontal lines")
-
-        # For debug visualization (only if needed)
-        barcode_annots = [] if create_debug else None
-        ocr_annots = [] if create_debug else None
-        areas = []
-
-        # Process each area between lines
-        for i in range(len(lines_y) - 1):
-            y1, y2 = lines_y[i], lines_y[i + 1]
-            if y2 - y1 < 50:  # Skip areas that are too small
-                continue
+def _assign_barcodes_to_areas(barcodes, area_bounds):
+    """
+    Bucket page-level barcode results by the area containing their vertical centre.
 
-            crop = img_cv[y1:y2, :]
-            if crop.size == 0:
-                continue
+    Args:
+        barcodes (list): Raw pyzbar results in page coordinates
+        area_bounds (list): (area_index, y1, y2) tuples sorted by y1
 
-            # Enhanced barcode detection
-            barcodes_data, raw_barcodes = detect_barcodes(crop, enhance_detection=enhance_quality)
-            
-            # Collect barcode annotations for debug (only if needed)
-            if create_debug and barcode_annots is not None:
-                for barcode in raw_barcodes:
-                    try:
-                        x, y, w, h = barcode.rect
-                        abs_rect = (x, y1 + y, w, h)
-                        decoded_data = barcode.data.decode('utf-8', errors='replace')
-                        barcode_annots.append((abs_rect, clean_barcode_value(decoded_data)))
-                    except Exception as e:
-                        print(f"Warning: Error processing barcode annotation: {e}")
-
-            # Enhanced OCR processing (single pass)
-            crop_for_ocr = preprocess_image_for_ocr(crop, enhance_quality=enhance_quality)
-            if crop_for_ocr is not None:
-                ocr_text = perform_ocr(reader, crop_for_ocr, use_cache=True)
-            else:
-                ocr_text = ""
-
-            # For debug annotations (simplified preview)
-            if create_debug and ocr_annots is not None:
-                preview_text = ocr_text[:80] + "..." if len(ocr_text) > 80 else ocr_text
-                ocr_annots.append((y1, preview_text.replace('\n', ' ')))
-
-            # Create area data
-            areas.append({
-                "page": page_num + 1,
-                "area_index": i,
-                "bbox": [int(y1), int(y2)],
-                "ocr_text": ocr_text,
-                "barcodes": barcodes_data
-            })
-
-        # Create debug image only if requested
-        debug_img = None
-        if create_debug:
-            debug_img = create_debug_image(img_cv, lines_y, barcode_annots or [], ocr_annots or [])
-
-        processing_time = time.time() - start_time
-        print(f"Page {page_num+1}: Processed {len(areas)} areas in {processing_time:.2f}s")
+    Returns:
+        list: One list of raw barcodes per entry in area_bounds
+    """
+    starts = [y1 for _, y1, _ in area_bounds]
+    buckets = [[] for _ in area_bounds]
+    for barcode in barcodes:
+        try:
+            _, top, _, height = barcode.rect
+        except (TypeError, ValueError):
+            continue
+        center = top + height / 2
+        k = bisect_right(starts, center) - 1
+        if k >= 0 and center < area_bounds[k][2]:
+            buckets[k].append(barcode)
+    return buckets
+
+def _prepare_page(page_num, img, create_debug=True, enhance_quality=True):
+    """
+    Run the OCR-independent part of page processing.
+
+    Detects the areas of the page, decodes the page's barcodes once and assigns
+    them to areas, and preprocesses each crop for OCR.
+
+    Returns:
+        dict: Prepared page data consumed by _recognize_pages
+    """
+    start_time = time.time()
+    # Rendered pages are RGB; view them without a copy and convert straight to
+    # grayscale, which is all line detection, barcodes and OCR preprocessing need
+    page_rgb = np.asarray(img)
+    page_gray = cv2.cvtColor(page_rgb, cv2.COLOR_RGB2GRAY)
+    lines_y = detect_horizontal_lines(page_gray)
+    print(f"Page {page_num+1}: Detected {len(lines_y)-2} areas between horizontal lines")
+
+    # For debug visualization (only if needed)
+    barcode_annots = [] if create_debug else None
+
+    # Areas between lines, skipping those that are too small
+    area_bounds = [(i, lines_y[i], lines_y[i + 1]) for i in range(len(lines_y) - 1)
+                   if lines_y[i + 1] - lines_y[i] >= 50]
+
+    # Decode the whole page once and hand each barcode to the area it sits in
+    page_barcodes = _assign_barcodes_to_areas(decode(Image.fromarray(page_gray)), area_bounds)
+
+    # Process each area: barcodes now, OCR batched per page later
+    area_barcodes = []
+    crops_for_ocr = []
+    for (i, y1, y2), raw_barcodes in zip(area_bounds, page_barcodes):
+        crop_gray = page_gray[y1:y2, :]
+        raw_top = 0  # Page-level results are in page coordinates
+
+        # Retry areas without a barcode with the enhanced strategies on the grayscale slice
+        if not raw_barcodes and enhance_quality:
+            raw_barcodes = _decode_enhanced(crop_gray)
+            raw_top = y1  # These are in area coordinates
+        barcodes_data = _barcode_records(raw_barcodes, y_shift=y1 - raw_top)
         
-        return areas, debug_img
+        # Collect barcode annotations for debug (only if needed)
+        if create_debug and barcode_annots is not None:
+            for barcode in raw_barcodes:
+                try:
+                    x, y, w, h = barcode.rect
+                    abs_rect = (x, raw_top + y, w, h)
+                    decoded_data = barcode.data.decode('utf-8', errors='replace')
+                    barcode_annots.append((abs_rect, clean_barcode_value(decoded_data)))
+                except Exception as e:
+                    print(f"Warning: Error processing barcode annotation: {e}")
+
+        area_barcodes.append(barcodes_data)
+        crops_for_ocr.append(preprocess_image_for_ocr(crop_gray, enhance_quality=enhance_quality))
+
+    return {
+        "page_num": page_num,
+        "page_rgb": page_rgb if create_debug else None,
+        "lines_y": lines_y,
+        "area_bounds": area_bounds,
+        "area_barcodes": area_barcodes,
+        "crops_for_ocr": crops_for_ocr,
+        "barcode_annots": barcode_annots,
+        "create_debug": create_debug,
+        "start_time": start_time
+    }
+
+def _build_page_results(prepared, ocr_texts):
+    """Combine a prepared page with its OCR texts into (areas, debug_img)."""
+    page_num = prepared["page_num"]
+    create_debug = prepared["create_debug"]
+    ocr_annots = [] if create_debug else None
+    areas = []
+
+    for (i, y1, y2), barcodes_data, ocr_text in zip(prepared["area_bounds"], prepared["area_barcodes"], ocr_texts):
+        # For debug annotations (simplified preview)
+        if create_debug and ocr_annots is not None:
+            preview_text = ocr_text[:80] + "..." if len(ocr_text) > 80 else ocr_text
+            ocr_annots.append((y1, preview_text.replace('\n', ' ')))
+
+        # Create area data
+        areas.append({
+            "page": page_num + 1,
+            "area_index": i,
+            "bbox": [int(y1), int(y2)],
+            "ocr_text": ocr_text,
+            "barcodes": barcodes_data
+        })
+
+    # Create debug image only if requested
+    debug_img = None
+    if create_debug:
+        # Drawing and cv2.imwrite expect BGR; only debug output pays for the conversion
+        img_cv = cv2.cvtColor(prepared["page_rgb"], cv2.COLOR_RGB2BGR)
+        debug_img = create_debug_image(img_cv, prepared["lines_y"],
+                                       prepared["barcode_annots"] or [], ocr_annots or [])
+
+    processing_time = time.time() - prepared["start_time"]
+    print(f"Page {page_num+1}: Processed {len(areas)} areas in {processing_time:.2f}s")
+
+    return areas, debug_img
+
+def _recognize_pages(prepared_pages, reader):
+    """
+    OCR one or more prepared pages with a single batched OCR call.
+
+    Args:
+        prepared_pages (list): Prepared page dicts from _prepare_page
+        reader (easyocr.Reader): OCR reader to use
+
+    Returns:
+        list: One (areas, debug_img) tuple per prepared page
+    """
+    crops = [crop for prepared in prepared_pages for crop in prepared["crops_for_ocr"]]
+    ocr_texts = perform_ocr_batch(reader, crops, use_cache=True) if crops else []
+
+    results = []
+    offset = 0
+    for prepared in prepared_pages:
+        count = len(prepared["crops_for_ocr"])
+        try:
+            results.append(_build_page_results(prepared, ocr_texts[offset:offset + count]))
+        except Exception as e:
+            print(f"Error processing page {prepared['page_num']+1}: {e}")
+            results.append(([], None))
+        offset += count
+    return results
+
+def process_page(page_num, img, reader, create_debug=True, enhance_quality=True):
+    """Optimized page processing with reduced redundancy."""
+    try:
+        prepared = _prepare_page(page_num, img, create_debug=create_debug, enhance_quality=enhance_quality)
+        return _recognize_pages([prepared], reader)[0]
         
     except Exception as e:
         print(f"Error processing page {page_num+1}: {e}")
         return [], None
 
+# Number of pages rasterised per convert_from_path call; bounds how many
+# rendered pages are held in memory at once.
+_RENDER_CHUNK_PAGES = 8
+
+def _iter_pdf_pages(pdf_path, page_count, chunk_size=_RENDER_CHUNK_PAGES):
+    """
+    Render PDF pages lazily in chunks, yielding (page_num, image) pairs.
+
+    Each chunk is rasterised by poppler using several threads, and only one
+    chunk of page images is alive at a time.
+    """
+    for first_page in range(1, page_count + 1, chunk_size):
+        last_page = min(first_page + chunk_size - 1, page_count)
+        thread_count = min(os.cpu_count() or 1, last_page - first_page + 1)
+        images = convert_from_path(pdf_path, first_page=first_page, last_page=last_page, thread_count=thread_count)
+        for offset, img in enumerate(images):
+            yield first_page - 1 + offset, img
+
+# Pipeline tuning: bounded queues keep only a few rendered/prepared pages in memory,
+# and the OCR stage groups the pages that are ready within _PIPELINE_OCR_WAIT seconds
+# into one batched OCR call, up to _OCR_BATCH_MAX_PIXELS of crops.
+_PIPELINE_QUEUE_SIZE = 4
+_PIPELINE_OCR_WAIT = 0.05
+_PIPELINE_DONE = object()
+
+def _prepared_ocr_pixels(item):
+    """Crop pixels a prepared pipeline item adds to an OCR batch (0 for failed pages and markers)."""
+    if not isinstance(item, dict):
+        return 0
+    return sum(crop.shape[0] * crop.shape[1] for crop in item["crops_for_ocr"] if crop is not None)
+
+def _run_page_pipeline(pdf_path, page_count, reader, create_debug=True, enhance_quality=True):
+    """
+    Process PDF pages with rendering, preparation and OCR overlapped across threads.
+
+    A render thread converts pages chunk by chunk into a bounded queue, a prepare
+    thread runs line detection, barcode decoding and OCR preprocessing, and the
+    calling thread runs batched OCR on whatever prepared pages are ready. If the
+    caller stops early (an exception or closing the generator), both threads are
+    stopped and the queues drained before returning.
+
+    Yields:
+        tuple: One (areas, debug_img) tuple per page, in page order
+    """
+    rendered = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    prepared = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    render_errors = []
+    stop = threading.Event()
+
+    def put(q, item):
+        # Poll instead of blocking on a full queue so the producers notice a stop
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_PIPELINE_OCR_WAIT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def render_pages():
+        try:
+            for page_num, img in _iter_pdf_pages(pdf_path, page_count):
+                if not put(rendered, (page_num, img)):
+                    return
+        except Exception as e:
+            render_errors.append(e)
+        finally:
+            put(rendered, _PIPELINE_DONE)
+
+    def prepare_pages():
+        while not stop.is_set():
+            try:
+                item = rendered.get(timeout=_PIPELINE_OCR_WAIT)
+            except queue.Empty:
+                continue
+            if item is _PIPELINE_DONE:
+                break
+            page_num, img = item
+            try:
+                result = _prepare_page(page_num, img, create_debug=create_debug, enhance_quality=enhance_quality)
+            except Exception as e:
+                print(f"Error processing page {page_num+1}: {e}")
+                result = (page_num, None)
+            if not put(prepared, result):
+                return
+        put(prepared, _PIPELINE_DONE)
+
+    threads = [
+        threading.Thread(target=render_pages, name="pdf-render", daemon=True),
+        threading.Thread(target=prepare_pages, name="page-prepare", daemon=True)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        done = False
+        while not done:
+            # Block for the next page, then pick up any others that are ready shortly after
+            batch = [prepared.get()]
+            pixels = _prepared_ocr_pixels(batch[-1])
+            while batch[-1] is not _PIPELINE_DONE and pixels < _OCR_BATCH_MAX_PIXELS:
+                try:
+                    batch.append(prepared.get(timeout=_PIPELINE_OCR_WAIT))
+                except queue.Empty:
+                    break
+                pixels += _prepared_ocr_pixels(batch[-1])
+            if batch[-1] is _PIPELINE_DONE:
+                batch.pop()
+                done = True
+
+            ready = []
+            for item in batch:
+                if isinstance(item, tuple):  # Page failed during preparation
+                    if ready:
+                        yield from _recognize_pages(ready, reader)
+                        ready = []
+                    yield [], None
+                else:
+                    ready.append(item)
+            if ready:
+                yield from _recognize_pages(ready, reader)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        # Release any pages still queued
+        for q in (rendered, prepared):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+
+    if render_errors:
+        raise render_errors[0]
+
+# Debug images are previews; a lower JPEG quality keeps them small and fast to encode
+_DEBUG_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 75, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+def _write_debug_image(debug_img_path, debug_img):
+    """Save one annotated page image and return its path."""
+    cv2.imwrite(debug_img_path, debug_img, _DEBUG_JPEG_PARAMS)
+    print(f"Saved debug image: {debug_img_path}")
+    return debug_img_path
+
 def extract_areas_from_pdf(pdf_path, lang_list=None, output_dir=None, parallel_processing=True, enhance_quality=True):
-    """Optimized PDF extraction with optional parallel processing."""
+    """
+    Optimized PDF extraction with optional pipelined processing.
+
+    Returns:
+        tuple: (areas, debug_image_paths); annotated page images are only
+        created and saved when output_dir is given
+    """
     if lang_list is None:
         lang_list = ['en']
     if not os.path.exists(pdf_path):
@@ -661,70 +1060,47 @@ def extract_areas_from_pdf(pdf_path, lang_list=None, output_dir=None, parallel_p
     start_time = time.time()
     print(f"Starting PDF processing: {pdf_path}")
     
-    # Setup
-    images = convert_from_path(pdf_path)
-    print(f"Converted PDF to {len(images)} images")
-    
-    # Create a single OCR reader instance (reuse for better performance)
-    reader = easyocr.Reader(lang_list)
+    # Reuse a cached OCR reader (model loading dominates start-up time)
+    reader = _get_reader(lang_list)
     all_areas = []
-    debug_images = []
     
-    create_debug = output_dir is not None
+    create_debug = bool(output_dir)
     
-    if parallel_processing and len(images) > 1:
-        # Parallel processing for multi-page documents
-        print(f"Using parallel processing for {len(images)} pages")
-        
-        def process_single_page(page_data):
-            page_num, img = page_data
-            return process_page(page_num, img, reader, create_debug=create_debug, enhance_quality=enhance_quality)
-        
-        # Use ThreadPoolExecutor for I/O bound OCR operations
-        max_workers = min(4, len(images))  # Limit to avoid memory issues
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all page processing tasks
-            future_to_page = {executor.submit(process_single_page, (i, img)): i 
-                            for i, img in enumerate(images)}
-            
-            # Collect results in order
-            page_results = [None] * len(images)
-            for future in as_completed(future_to_page):
-                page_num = future_to_page[future]
-                try:
-                    page_areas, debug_img = future.result()
-                    page_results[page_num] = (page_areas, debug_img)
-                except Exception as e:
-                    print(f"Error processing page {page_num + 1}: {e}")
-                    page_results[page_num] = ([], None)
-            
-            # Flatten results
-            for page_areas, debug_img in page_results:
-                if page_areas:
-                    all_areas.extend(page_areas)
-                if debug_img is not None:
-                    debug_images.append(debug_img)
+    page_count = pdfinfo_from_path(pdf_path)["Pages"]
+    print(f"PDF has {page_count} pages")
+
+    if parallel_processing and page_count > 1:
+        # Pipelined processing for multi-page documents: render, prepare and OCR overlap
+        print(f"Using pipelined processing for {page_count} pages")
+        page_results = _run_page_pipeline(
+            pdf_path, page_count, reader,
+            create_debug=create_debug,
+            enhance_quality=enhance_quality
+        )
     else:
         # Sequential processing
         print("Using sequential processing")
-        for page_num, img in enumerate(images):
-            page_areas, debug_img = process_page(
+        page_results = (
+            process_page(
                 page_num, img, reader, 
                 create_debug=create_debug, 
                 enhance_quality=enhance_quality
             )
-            all_areas.extend(page_areas)
-            if debug_img is not None:
-                debug_images.append(debug_img)
+            for page_num, img in _iter_pdf_pages(pdf_path, page_count)
+        )
 
-    # Save debug images if output_dir provided
-    if output_dir and debug_images:
+    # Debug images are written as each page finishes, on a background thread,
+    # so they never accumulate in memory for long documents
+    if create_debug:
         os.makedirs(output_dir, exist_ok=True)
-        for page_num, debug_img in enumerate(debug_images):
+    debug_writes = []
+    with ThreadPoolExecutor(max_workers=1) as debug_writer:
+        for page_num, (page_areas, debug_img) in enumerate(page_results):
+            all_areas.extend(page_areas)
             if debug_img is not None:
                 debug_img_path = os.path.join(output_dir, f'page_{page_num+1}_areas.jpg')
-                cv2.imwrite(debug_img_path, debug_img)
-                print(f"Saved debug image: {debug_img_path}")
+                debug_writes.append(debug_writer.submit(_write_debug_image, debug_img_path, debug_img))
+    debug_images = [write.result() for write in debug_writes]
     
     processing_time = time.time() - start_time
     print(f"PDF processing completed in {processing_time:.2f}s - extracted {len(all_areas)} areas")
@@ -735,6 +1111,134 @@ def extract_areas_from_pdf(pdf_path, lang_list=None, output_dir=None, parallel_p
 # Job Number and Operations Extraction Functions
 #############################################
 
+# Operation number/name patterns, tried in order on each area's OCR text
+_OPERATION_PATTERNS = [
+    # Multi-line pattern: operation number on one line, name on next, optionally
+    # after a year line, unless the line after the year is itself a bare number
+    re.compile(r'^(?:Operation\s+)?(\d+(?:\.\d+)?)\s*[\n\r]+\s*(?:20\d\d\s*\n(?!\s*\d+(?:\.\d+)?\s*(?:\n|$)))?([^\x00]+?)(?:\n|$)',
+               re.MULTILINE | re.DOTALL),
+    # Single line with "Operation" prefix
+    re.compile(r'^Operation\s+(\d+(?:\.\d+)?)\s+([^\x00]+?)(?:\s*(?:Scan|~)|$)', re.MULTILINE | re.DOTALL),
+    # Operation with year pattern (like "150 2022 3D PRINTING")
+    re.compile(r'^(\d+(?:\.\d+)?)\s+(?:20\d\d\s+)?([^\x00]+?)(?:\s*(?:Scan|~)|$)', re.MULTILINE | re.DOTALL),
+]
+
+# Obvious non-operations (dates, codes, quantities, etc.)
+_OPERATION_SKIP_PATTERNS = [
+    re.compile(r'^\d{1,2}[-/]\w+[-/]\d{4}$', re.IGNORECASE),  # Dates like "16-January-2025"
+    re.compile(r'^[A-Z]{2,3}\d{4,6}$', re.IGNORECASE),        # Codes like "AM0135"
+    re.compile(r'^\d+\.\d+$', re.IGNORECASE),                 # Quantities like "10.00"
+    re.compile(r'^[A-Z]{1,3}\d{1,3}$', re.IGNORECASE),        # Short codes (but allow if followed by manufacturing terms)
+    re.compile(r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b', re.IGNORECASE),  # Month names
+    re.compile(r'^\d+\.\d+\s*(Qty|delivered)', re.IGNORECASE),  # Quantity-related text
+]
+
+# Non-operations starting with a whole header word, compared case-folded: common
+# header words, OCR errors of "Enter Activity" and table headers
+_HEADER_WORD_PREFIXES = ('scan', 'enter', 'activity', 'qty', 'delivered', 'so', 'far',
+                         'entcr', 'acttvity', 'target', 'time')
+
+def _starts_with_header_word(text):
+    """True if text starts with one of _HEADER_WORD_PREFIXES followed by a non-word character or the end."""
+    folded = text.casefold()
+    if not folded.startswith(_HEADER_WORD_PREFIXES):
+        return False
+    for prefix in _HEADER_WORD_PREFIXES:
+        if folded.startswith(prefix):
+            following = folded[len(prefix):len(prefix) + 1]
+            if not (following.isalnum() or following == '_'):
+                return True
+    return False
+
+# Manufacturing-related keywords, or all caps (common for operation names)
+_MANUFACTURING_INDICATORS = [
+    re.compile(r'\b(PRINT|CUT|CLEAN|BLAST|MACHINE|MILL|DRILL|WELD|ASSEMBLE|INSPECT|TEST)\b', re.IGNORECASE),
+    re.compile(r'^[A-Z\s]+$', re.IGNORECASE),  # All caps operation names
+    re.compile(r'\b(Wire|Sonic|Dry|EDM|WASH)\b', re.IGNORECASE),  # Common operation words
+    re.compile(r'\b(3D|ULTRA|Bead)\b', re.IGNORECASE),  # Specific manufacturing terms
+]
+
+# Barcode-to-operation number patterns
+_BARCODE_OP_PATTERNS = [
+    re.compile(r'J\w*Q(\d+)$'),  # Standard J...Q### format
+    re.compile(r'.*Q(\d+)$'),    # Any barcode ending with Q###
+    re.compile(r'.*-(\d+)$'),    # Barcodes ending with -###
+    re.compile(r'.*(\d{2,3})$'), # Last 2-3 digits as operation number
+]
+
+_ALPHA_RUN_RE = re.compile(r'[A-Za-z]{3,}')
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+
+# Noise removed from operation names in a single pass:
+# - Year prefixes (like "2022" seen in example-01.json)
+# - Scan barcode instructions, through to the end of the text:
+#   - Hyphenated format: "~Scan-barcodes-to-start-job operation"
+#   - Standard format: "Scan barcodes to start job operation"
+#   - Other common variations: any remaining scan instruction
+_OPERATION_NAME_NOISE_RE = re.compile(
+    r'^20\d\d\s+'
+    r'|\s*(?:~?[sS]can-barcodes-(?:t[o0]|to)-start-job\s+operation'
+    r'|[sS]can\s+barcodes\s+(?:t[o0]\s+|to\s+)?start\s+job\s+operation'
+    r'|~?\s*[sS]can).*$'
+)
+
+# Job numbers in header OCR text
+_JOB_NUMBER_PATTERNS = [
+    re.compile(r'(?:Job\s*No\.?|Job\s*Number)[:\s]*([A-Z0-9]+)', re.IGNORECASE),
+    re.compile(r'(?:Job)[:\s]*([A-Z0-9]{6,})', re.IGNORECASE),  # Job codes are typically 6+ characters
+    re.compile(r'(?:Work\s*Order|WO)[:\s]*([A-Z0-9]+)', re.IGNORECASE),
+]
+
+# Operation references marking the end of the header areas
+_OPERATION_REFERENCE_RE = re.compile(r'(?:operation|op)\s*\d+')
+
+# Keywords every quantity / delivery date pattern needs; one alternation scan
+# decides whether an area's text is worth trying the full pattern family on
+_QUANTITY_ANCHOR_RE = re.compile(r'Qt|Quantity|Pc|Piece|Unit', re.IGNORECASE)
+_DELIVERY_DATE_ANCHOR_RE = re.compile(r'Date|Required\s*by|Needed\s*by|Complete\s*by', re.IGNORECASE)
+
+# Quantity fields in header OCR text
+_QUANTITY_PATTERNS = [
+    re.compile(r'(?:Quantity|QTY|Qty)\s*[:\-]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # Basic quantity patterns
+    re.compile(r'(?:Qty\s*of\s*traceable\s*items?)\s*[:\-]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # Traceable items
+    re.compile(r'(?:Total\s*Qty?)\s*[:\-]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # Total quantity
+    re.compile(r'(?:Pieces?|Pcs?)\s*[:\-]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # Pieces
+    re.compile(r'(?:Units?)\s*[:\-]?\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # Units
+]
+
+# Delivery date fields in header OCR text, in several formats
+_DELIVERY_DATE_PATTERNS = [
+    # Standard formats
+    re.compile(r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE),
+    re.compile(r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[-]\d{1,2}[-]\d{4})', re.IGNORECASE),
+    # Month name formats
+    re.compile(r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4})', re.IGNORECASE),
+    # ISO format
+    re.compile(r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})', re.IGNORECASE),
+    # Flexible date patterns
+    re.compile(r'(?:Required\s*by|Needed\s*by|Complete\s*by)\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE),
+]
+
+def _first_page_areas(json_data):
+    """Return the areas of the first page ordered by area_index."""
+    return sorted((area for area in json_data if area.get('page', 0) == 1),
+                  key=lambda x: x.get('area_index', 0))
+
+def _area_columns(areas):
+    """
+    Split area records into parallel columns for the job details scans.
+
+    Args:
+        areas (list): List of area dictionaries
+
+    Returns:
+        tuple: (stripped OCR texts, first barcode value of each area or None if it has none)
+    """
+    ocr_texts = [area.get('ocr_text', '').strip() for area in areas]
+    first_barcodes = [area['barcodes'][0].get('barcode', '') if area.get('barcodes') else None
+                      for area in areas]
+    return ocr_texts, first_barcodes
+
 def extract_job_number(json_data):
     """
     Extract job number from the JSON data.
@@ -748,29 +1252,21 @@ def extract_job_number(json_data):
     Returns:
         str: The job number or empty string if not found
     """
-    # Sort areas by page and area_index to ensure proper ordering
-    sorted_areas = sorted(json_data, key=lambda x: (x.get('page', 0), x.get('area_index', 0)))
-
-    # First approach: Look for areas with "Job No" in OCR text
-    for area in sorted_areas:
-        if area.get('page', 0) != 1:  # Only look at the first page
+    # Single pass: prefer the first area with "Job No" in its OCR text, and remember
+    # the first barcode on the page as the fallback
+    fallback = None
+    for area in _first_page_areas(json_data):
+        if not area.get('barcodes'):
             continue
-
-        ocr_text = area.get('ocr_text', '').strip()
-        if 'Job No' in ocr_text and 'barcodes' in area and area['barcodes']:
+        # Plain substring test; stripping the text first cannot change the result
+        if 'Job No' in area.get('ocr_text', ''):
             # Return the value of the first barcode in this area
             return area['barcodes'][0].get('barcode', '')
+        if fallback is None:
+            fallback = area['barcodes'][0].get('barcode', '')
 
-    # Second approach: Just take the first barcode from the first page if available
-    for area in sorted_areas:
-        if area.get('page', 0) != 1:  # Only look at the first page
-            continue
-
-        if 'barcodes' in area and area['barcodes']:
-            return area['barcodes'][0].get('barcode', '')
-
-    # If no barcode found, return empty string
-    return ''
+    # Otherwise the first barcode from the first page, or empty string if none
+    return fallback if fallback is not None else ''
 
 def extract_job_details(json_data):
     """
@@ -792,35 +1288,26 @@ def extract_job_details(json_data):
     if not json_data:
         return job_details
 
-    # Sort areas by page and area_index to ensure proper ordering
-    sorted_areas = sorted(json_data, key=lambda x: (x.get('page', 0), x.get('area_index', 0)))
-
-    # Get first page areas
-    first_page_areas = [area for area in sorted_areas if area.get('page', 0) == 1]
+    first_page_areas = _first_page_areas(json_data)
     if not first_page_areas:
         return job_details
 
-    # Enhanced job number extraction with multiple strategies
-    job_number_patterns = [
-        r'(?:Job\s*No\.?|Job\s*Number)[:\s]*([A-Z0-9]+)',
-        r'(?:Job)[:\s]*([A-Z0-9]{6,})',  # Job codes are typically 6+ characters
-        r'(?:Work\s*Order|WO)[:\s]*([A-Z0-9]+)',
-    ]
-    
+    # Stripped text and first barcode of each area, extracted once for all scans below
+    ocr_texts, first_barcodes = _area_columns(first_page_areas)
+
     # Strategy 1: Look for job number in areas with "Job No" text and barcodes
-    for area in first_page_areas:
-        ocr_text = area.get('ocr_text', '').strip()
-        if any(keyword in ocr_text.upper() for keyword in ['JOB NO', 'JOB NUMBER', 'WORK ORDER']):
+    for ocr_text, barcode_value in zip(ocr_texts, first_barcodes):
+        ocr_text_upper = ocr_text.upper()  # Uppercase once, not once per keyword
+        if any(keyword in ocr_text_upper for keyword in ('JOB NO', 'JOB NUMBER', 'WORK ORDER')):
             # Check if there's a barcode in this area
-            if 'barcodes' in area and area['barcodes']:
-                barcode_value = area['barcodes'][0].get('barcode', '')
+            if barcode_value is not None:
                 if len(barcode_value) >= 6:  # Valid job numbers are typically longer
                     job_details["job_number"] = barcode_value
                     break
             
             # Try to extract from OCR text using patterns
-            for pattern in job_number_patterns:
-                match = re.search(pattern, ocr_text, re.IGNORECASE)
+            for pattern in _JOB_NUMBER_PATTERNS:
+                match = pattern.search(ocr_text)
                 if match and len(match.group(1)) >= 6:
                     job_details["job_number"] = match.group(1)
                     break
@@ -829,9 +1316,8 @@ def extract_job_details(json_data):
 
     # Strategy 2: If no job number found, look for the first substantial barcode
     if not job_details["job_number"]:
-        for area in first_page_areas:
-            if 'barcodes' in area and area['barcodes']:
-                barcode_value = area['barcodes'][0].get('barcode', '')
+        for barcode_value in first_barcodes:
+            if barcode_value is not None:
                 # Filter out obviously non-job-number barcodes
                 if len(barcode_value) >= 6 and not barcode_value.isdigit():
                     job_details["job_number"] = barcode_value
@@ -841,30 +1327,23 @@ def extract_job_details(json_data):
     first_op_index = -1
     operation_keywords = ['operation', 'scan barcodes to start', 'op ', 'step ']
     
-    for i, area in enumerate(first_page_areas):
-        ocr_text = area.get('ocr_text', '').strip().lower()
+    for i, ocr_text in enumerate(ocr_texts):
+        ocr_text = ocr_text.lower()
         if any(keyword in ocr_text for keyword in operation_keywords):
             # Additional check for operation numbers
-            if re.search(r'(?:operation|op)\s*\d+', ocr_text) or 'scan barcodes' in ocr_text:
+            if _OPERATION_REFERENCE_RE.search(ocr_text) or 'scan barcodes' in ocr_text:
                 first_op_index = i
                 break
 
     # Define header areas (before operations)
-    header_areas = first_page_areas[:first_op_index] if first_op_index > 0 else first_page_areas
-
-    # Enhanced quantity extraction with better patterns
-    quantity_patterns = [
-        r'(?:Quantity|QTY|Qty)\s*[:\-]?\s*(\d+(?:\.\d+)?)',  # Basic quantity patterns
-        r'(?:Qty\s*of\s*traceable\s*items?)\s*[:\-]?\s*(\d+(?:\.\d+)?)',  # Traceable items
-        r'(?:Total\s*Qty?)\s*[:\-]?\s*(\d+(?:\.\d+)?)',  # Total quantity
-        r'(?:Pieces?|Pcs?)\s*[:\-]?\s*(\d+(?:\.\d+)?)',  # Pieces
-        r'(?:Units?)\s*[:\-]?\s*(\d+(?:\.\d+)?)',  # Units
-    ]
+    header_texts = ocr_texts[:first_op_index] if first_op_index > 0 else ocr_texts
 
-    for area in header_areas:
-        ocr_text = area.get('ocr_text', '').strip()
-        for pattern in quantity_patterns:
-            quantity_match = re.search(pattern, ocr_text, re.IGNORECASE)
+    # Quantity from the header areas
+    for ocr_text in header_texts:
+        if not _QUANTITY_ANCHOR_RE.search(ocr_text):
+            continue
+        for pattern in _QUANTITY_PATTERNS:
+            quantity_match = pattern.search(ocr_text)
             if quantity_match:
                 qty_value = quantity_match.group(1)
                 # Validate quantity (should be reasonable)
@@ -878,23 +1357,12 @@ def extract_job_details(json_data):
         if job_details["quantity"]:
             break
 
-    # Enhanced delivery date extraction with more formats
-    date_patterns = [
-        # Standard formats
-        r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[-]\d{1,2}[-]\d{4})',
-        # Month name formats
-        r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4})',
-        # ISO format
-        r'(?:Delivery\s*Date|Del\.?\s*Date|Due\s*Date|Date\s*Required)\s*[:\-]?\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
-        # Flexible date patterns
-        r'(?:Required\s*by|Needed\s*by|Complete\s*by)\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-    ]
-
-    for area in header_areas:
-        ocr_text = area.get('ocr_text', '').strip()
-        for pattern in date_patterns:
-            date_match = re.search(pattern, ocr_text, re.IGNORECASE)
+    # Delivery date from the header areas
+    for ocr_text in header_texts:
+        if not _DELIVERY_DATE_ANCHOR_RE.search(ocr_text):
+            continue
+        for pattern in _DELIVERY_DATE_PATTERNS:
+            date_match = pattern.search(ocr_text)
             if date_match:
                 date_value = date_match.group(1)
                 # Basic date validation
@@ -906,6 +1374,7 @@ def extract_job_details(json_data):
 
     return job_details
 
+@lru_cache(maxsize=4096)
 def clean_operation_name(op_name):
     """
     Clean up operation name by removing scan barcode instructions and other noise.
@@ -916,27 +1385,31 @@ def clean_operation_name(op_name):
     Returns:
         str: Cleaned operation name
     """
-    # Remove year prefixes (like "2022" seen in example-01.json)
-    year_pattern = r'^(?:20\d\d\s+)'
-    op_name = re.sub(year_pattern, '', op_name)
+    # Remove year prefixes and scan barcode instructions
+    return _OPERATION_NAME_NOISE_RE.sub('', op_name).strip()
 
-    # Remove various forms of scan barcode instructions
-    patterns = [
-        # Standard format: "Scan barcodes to start job operation"
-        r'\s*[sS]can\s+barcodes\s+(?:t[o0]\s+|to\s+)?start\s+job\s+operation.*$',
+# Joins area texts for a single regex pass. The operation name groups exclude NUL
+# and '\s' does not match it, so no operation pattern can match across areas
+_AREA_TEXT_SEPARATOR = '\n\x00\n'
 
-        # Hyphenated format: "~Scan-barcodes-to-start-job operation"
-        r'\s*~?[sS]can-barcodes-(?:t[o0]|to)-start-job\s+operation.*$',
-
-        # Other common variations
-        r'\s*~?\s*[sS]can.*$',  # Catch any remaining scan instructions
-    ]
+def _match_operation_patterns(texts):
+    """
+    Run each operation pattern once over all texts joined together.
 
-    cleaned_name = op_name
-    for pattern in patterns:
-        cleaned_name = re.sub(pattern, '', cleaned_name)
+    Args:
+        texts (list): OCR texts, one per area
 
-    return cleaned_name.strip()
+    Returns:
+        list: One list per text of (pattern_index, match) pairs, in pattern
+        order and then by position, as if each text had been searched alone
+    """
+    joined = _AREA_TEXT_SEPARATOR.join(texts)
+    starts = list(accumulate((len(text) + len(_AREA_TEXT_SEPARATOR) for text in texts[:-1]), initial=0))
+    matches_by_text = [[] for _ in texts]
+    for pattern_idx, pattern in enumerate(_OPERATION_PATTERNS):
+        for match in pattern.finditer(joined):
+            matches_by_text[bisect_right(starts, match.start()) - 1].append((pattern_idx, match))
+    return matches_by_text
 
 def extract_operations(json_data, logger=None):
     """
@@ -958,6 +1431,8 @@ def extract_operations(json_data, logger=None):
         return []
         
     operations_dict = {}  # Dictionary keyed by operation number
+    op_sort_keys = {}  # Numeric value of each operation number, parsed once
+    operations_by_area = {}  # Operations grouped by the area they were found in
     barcodes_by_op_number = {}  # Dictionary to store barcodes
     area_barcodes = {}  # Store barcodes by area for proximity matching
 
@@ -969,120 +1444,86 @@ def extract_operations(json_data, logger=None):
         logger.log_main("info", f"Starting operation extraction from {len(json_data)} areas")
 
     try:
-        # First pass: Extract operations and collect barcodes
+        # First pass: match the operation patterns over the text of all areas at once
+        text_areas = []
         for area_idx, area in enumerate(json_data):
             ocr_text = area.get('ocr_text', '').strip()
+            if ocr_text:
+                text_areas.append((area_idx, area, ocr_text))
+        area_matches = _match_operation_patterns([ocr_text for _, _, ocr_text in text_areas])
+
+        # Extract operations and collect barcodes, area by area
+        for (area_idx, area, _), matches in zip(text_areas, area_matches):
             barcodes = area.get('barcodes', [])
             page = area.get('page', 0)
 
-            if not ocr_text:
-                continue
+            for pattern_idx, match in matches:
+                op_number = match.group(1)
+                op_name_raw = match.group(2).strip()
 
-            # Enhanced operation patterns - balanced to catch real operations
-            operation_patterns = [
-                # Multi-line pattern: operation number on one line, name on next
-                r'^(?:Operation\s+)?(\d+(?:\.\d+)?)\s*[\n\r]+\s*(.+?)(?:\n|$)',
-                # Single line with "Operation" prefix
-                r'^Operation\s+(\d+(?:\.\d+)?)\s+(.+?)(?:\s*(?:Scan|~)|$)',
-                # Operation with year pattern (like "150 2022 3D PRINTING")
-                r'^(\d+(?:\.\d+)?)\s+(?:20\d\d\s+)?(.+?)(?:\s*(?:Scan|~)|$)',
-                # Line-by-line pattern for operations split across lines
-                r'(?:^|\n)(\d+(?:\.\d+)?)\s*\n(?:20\d\d\s*\n)?(.+?)(?=\n|$)',
-            ]
-
-            patterns_tried = []
-            successful_pattern = ""
-
-            # Try each pattern
-            for pattern in operation_patterns:
-                patterns_tried.append(pattern)
-                matches = re.finditer(pattern, ocr_text, re.MULTILINE | re.DOTALL)
-                for match in matches:
-                    op_number = match.group(1)
-                    op_name_raw = match.group(2).strip()
-
-                    # Validate operation number
-                    try:
-                        op_num_float = float(op_number)
-                        op_num_int = int(op_num_float)
-                        if not (MIN_OP_NUMBER <= op_num_int <= MAX_OP_NUMBER):
-                            continue
-                    except (ValueError, TypeError):
+                # Validate operation number
+                try:
+                    op_num_float = float(op_number)
+                    op_num_int = int(op_num_float)
+                    if not (MIN_OP_NUMBER <= op_num_int <= MAX_OP_NUMBER):
                         continue
+                except (ValueError, TypeError):
+                    continue
 
-                    # Clean operation name
-                    op_name = clean_operation_name(op_name_raw)
-                    
-                    # Enhanced filtering to exclude non-operation content
-                    if len(op_name) < 2 or op_name.isdigit():
-                        continue
-                    
-                    # Skip obvious non-operations (dates, codes, quantities, etc.)
-                    skip_patterns = [
-                        r'^\d{1,2}[-/]\w+[-/]\d{4}$',  # Dates like "16-January-2025"
-                        r'^[A-Z]{2,3}\d{4,6}$',        # Codes like "AM0135"
-                        r'^\d+\.\d+$',                 # Quantities like "10.00"
-                        r'^(SCAN|Enter|Activity|Qty|delivered|so|far)\b',  # Common header words
-                        r'^[A-Z]{1,3}\d{1,3}$',        # Short codes (but allow if followed by manufacturing terms)
-                        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',  # Month names
-                        r'^(Entcr|Acttvity)\b',        # OCR errors of "Enter Activity"
-                        r'^\d+\.\d+\s*(Qty|delivered)',  # Quantity-related text
-                        r'^(Target|Time)\b',           # Table headers
-                    ]
-                    
-                    if any(re.search(pattern, op_name, re.IGNORECASE) for pattern in skip_patterns):
-                        continue
-                    
-                    # Only accept operations that look like manufacturing processes
-                    # Must contain meaningful alphabetic content
-                    if not re.search(r'[A-Za-z]{3,}', op_name):
-                        continue
-                    
-                    # Additional check: operation names should contain manufacturing-related keywords
-                    # or be all caps (common for operation names)
-                    manufacturing_indicators = [
-                        r'\b(PRINT|CUT|CLEAN|BLAST|MACHINE|MILL|DRILL|WELD|ASSEMBLE|INSPECT|TEST)\b',
-                        r'^[A-Z\s]+$',  # All caps operation names
-                        r'\b(Wire|Sonic|Dry|EDM|WASH)\b',  # Common operation words
-                        r'\b(3D|ULTRA|Bead)\b',  # Specific manufacturing terms
-                    ]
-                    
-                    # Be more lenient - if it has manufacturing indicators OR looks like an operation name
-                    has_manufacturing_terms = any(re.search(pattern, op_name, re.IGNORECASE) for pattern in manufacturing_indicators)
-                    looks_like_operation = len(op_name) >= 4 and re.search(r'[A-Z]', op_name) and not op_name.isdigit()
-                    
-                    if not (has_manufacturing_terms or looks_like_operation):
-                        continue
+                # Clean operation name
+                op_name = clean_operation_name(op_name_raw)
+                
+                # Enhanced filtering to exclude non-operation content
+                if len(op_name) < 2 or op_name.isdigit():
+                    continue
+                
+                # Skip obvious non-operations (dates, codes, quantities, etc.)
+                if _starts_with_header_word(op_name) or any(skip.search(op_name) for skip in _OPERATION_SKIP_PATTERNS):
+                    continue
+                
+                # Only accept operations that look like manufacturing processes
+                # Must contain meaningful alphabetic content
+                if not _ALPHA_RUN_RE.search(op_name):
+                    continue
+                
+                # Be more lenient - if it has manufacturing indicators OR looks like an operation name
+                has_manufacturing_terms = any(indicator.search(op_name) for indicator in _MANUFACTURING_INDICATORS)
+                looks_like_operation = len(op_name) >= 4 and _UPPERCASE_RE.search(op_name) and not op_name.isdigit()
+                
+                if not (has_manufacturing_terms or looks_like_operation):
+                    continue
 
-                    # Store operation (avoid duplicates, prefer first occurrence)
-                    if op_number not in operations_dict:
-                        successful_pattern = pattern
-                        operations_dict[op_number] = {
-                            'op_number': op_number,
-                            'op_name': op_name,
-                            'op_id': '',
-                            'page': page,
-                            'area_index': area_idx,
-                            'confidence': 1.0,  # Base confidence
-                            'extraction_strategy': '',
-                            'pattern_matched': successful_pattern
-                        }
-                        
-                        # Setup operation logger and log extraction
-                        if logger:
-                            op_logger = logger.setup_operation_logger(op_number, op_name)
-                            logger.log_operation_patterns(op_number, patterns_tried, successful_pattern)
-                            logger.log_operation(op_number, "info", f"Operation found in area {area_idx} on page {page}")
-                            logger.log_operation(op_number, "info", f"Raw operation name: '{op_name_raw}'")
-                            logger.log_operation(op_number, "info", f"Cleaned operation name: '{op_name}'")
+                # Store operation (avoid duplicates, prefer first occurrence)
+                if op_number not in operations_dict:
+                    successful_pattern = _OPERATION_PATTERNS[pattern_idx].pattern
+                    operations_dict[op_number] = {
+                        'op_number': op_number,
+                        'op_name': op_name,
+                        'op_id': '',
+                        'page': page,
+                        'area_index': area_idx,
+                        'confidence': 1.0,  # Base confidence
+                        'extraction_strategy': '',
+                        'pattern_matched': successful_pattern
+                    }
+                    op_sort_keys[op_number] = op_num_float
+                    operations_by_area.setdefault(area_idx, []).append(operations_dict[op_number])
+                    
+                    # Setup operation logger and log extraction
+                    if logger:
+                        op_logger = logger.setup_operation_logger(op_number, op_name)
+                        patterns_tried = [pattern.pattern for pattern in _OPERATION_PATTERNS[:pattern_idx + 1]]
+                        logger.log_operation_patterns(op_number, patterns_tried, successful_pattern)
+                        logger.log_operation(op_number, "info", f"Operation found in area {area_idx} on page {page}")
+                        logger.log_operation(op_number, "info", f"Raw operation name: '{op_name_raw}'")
+                        logger.log_operation(op_number, "info", f"Cleaned operation name: '{op_name}'")
 
             # Process barcodes in this area
             if barcodes:
                 area_barcodes[area_idx] = []
                 
                 # Log barcode detection for any operations found in this area
-                area_operations = [op for op in operations_dict.values() if op['area_index'] == area_idx]
-                for op in area_operations:
+                for op in operations_by_area.get(area_idx, ()):
                     if logger:
                         logger.log_barcode_detection(op['op_number'], area_idx, barcodes)
                 
@@ -1090,19 +1531,14 @@ def extract_operations(json_data, logger=None):
                     barcode_value = barcode.get('barcode', '')
                     if not barcode_value:
                         continue
+                    # Op IDs share one string per distinct barcode value, whoever built the area data
+                    barcode_value = sys.intern(barcode_value)
                         
                     area_barcodes[area_idx].append(barcode_value)
                     
                     # Enhanced barcode-to-operation matching
-                    barcode_patterns = [
-                        r'J\w*Q(\d+)$',  # Standard J...Q### format
-                        r'.*Q(\d+)$',    # Any barcode ending with Q###
-                        r'.*-(\d+)$',    # Barcodes ending with -###
-                        r'.*(\d{2,3})$', # Last 2-3 digits as operation number
-                    ]
-                    
-                    for bc_pattern in barcode_patterns:
-                        bc_match = re.search(bc_pattern, barcode_value)
+                    for bc_pattern in _BARCODE_OP_PATTERNS:
+                        bc_match = bc_pattern.search(barcode_value)
                         if bc_match:
                             extracted_op_num = bc_match.group(1)
                             try:
@@ -1111,7 +1547,7 @@ def extract_operations(json_data, logger=None):
                                     # Log barcode-to-operation mapping
                                     if logger and extracted_op_num in operations_dict:
                                         logger.log_operation(extracted_op_num, "info", 
-                                                           f"Barcode '{barcode_value}' mapped to operation {extracted_op_num} using pattern: {bc_pattern}")
+                                                           f"Barcode '{barcode_value}' mapped to operation {extracted_op_num} using pattern: {bc_pattern.pattern}")
                                     break
                             except ValueError:
                                 continue
@@ -1194,7 +1630,7 @@ def extract_operations(json_data, logger=None):
         # Convert to sorted list and clean up
         operations_list = []
         successful_extractions = 0
-        for op_number in sorted(operations_dict.keys(), key=lambda x: float(x)):
+        for op_number in sorted(operations_dict, key=op_sort_keys.__getitem__):
             op = operations_dict[op_number].copy()
             if op.get('op_id'):
                 successful_extractions += 1
@@ -1357,11 +1793,10 @@ def process_pdf_document(pdf_path, output_dir=None, lang_list=None, save_raw=Tru
             if logger:
                 if job_and_operations.get('job_number'):
                     logger.job_number = job_and_operations['job_number']
-                
-                # Convert from pdf2image to get page count
-                from pdf2image import convert_from_path
-                images = convert_from_path(pdf_path)
-                logger.set_document_info(len(images), len(areas))
+
+                # Page count from the PDF itself: trailing blank or failed pages yield no areas
+                total_pages = pdfinfo_from_path(pdf_path)["Pages"]
+                logger.set_document_info(total_pages, len(areas))
             
             # Validate results
             if not isinstance(job_and_operations, dict):
@@ -1459,6 +1894,28 @@ def process_pdf_document(pdf_path, output_dir=None, lang_list=None, save_raw=Tru
 # Command Line Interface
 #############################################
 
+def _init_pdf_worker(lang_list, num_threads):
+    """
+    Initialize a document worker process.
+
+    Limits OpenCV and torch to this worker's share of the CPU cores, so parallel
+    workers do not oversubscribe the machine, and loads the OCR reader up front.
+
+    Args:
+        lang_list (list): Language codes for the OCR reader
+        num_threads (int): Number of threads each native library may use
+    """
+    cv2.setNumThreads(num_threads)
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+    try:
+        _get_reader(lang_list)
+    except Exception as e:
+        print(f"Warning: Could not preload OCR reader: {e}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="Process PDF job documents and extract job number and operations"
@@ -1512,6 +1969,12 @@ def main():
         default=False,
         help="Use faster processing with reduced quality enhancements (default: False)"
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Number of PDFs to process concurrently in separate processes (default: 1)"
+    )
     parser.add_argument(
         "-v", "--version",
         action="store_true",
@@ -1533,18 +1996,41 @@ def main():
     save_raw = args.raw if args.raw else not args.no_raw
     parallel_processing = args.parallel if args.parallel else not args.no_parallel
 
+    process_kwargs = dict(
+        output_dir=args.output_dir,
+        lang_list=args.lang,
+        save_raw=save_raw,
+        save_annotated=not args.no_annotated,
+        parallel_processing=parallel_processing,
+        enhance_quality=not args.fast_mode
+    )
+
+    workers = min(args.workers, len(args.pdf_files))
+    if workers > 1:
+        # Each worker process loads the OCR models once and gets its share of the cores
+        print(f"Processing {len(args.pdf_files)} PDFs with {workers} worker processes")
+        threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker,
+                                 initargs=(args.lang, threads_per_worker)) as executor:
+            futures = [(pdf_file, executor.submit(process_pdf_document, pdf_file, **process_kwargs))
+                       for pdf_file in args.pdf_files]
+            for pdf_file, future in futures:
+                try:
+                    result = future.result()
+
+                    # If no output directory specified, print the result to console
+                    if not args.output_dir:
+                        print(f"\nExtracted job and operations ({pdf_file}):")
+                        print(json.dumps(result, indent=2))
+
+                except Exception as e:
+                    print(f"Error processing {pdf_file}: {str(e)}")
+        return
+
     for pdf_file in args.pdf_files:
         print(f"\nProcessing {pdf_file}...")
         try:
-            result = process_pdf_document(
-                pdf_file,
-                output_dir=args.output_dir,
-                lang_list=args.lang,
-                save_raw=save_raw,
-                save_annotated=not args.no_annotated,
-                parallel_processing=parallel_processing,
-                enhance_quality=not args.fast_mode
-            )
+            result = process_pdf_document(pdf_file, **process_kwargs)
 
             # If no output directory specified, print the result to console
             if not args.output_dir:
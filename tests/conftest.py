@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Imported before the test modules: keep them, and job_card_extractor, from writing
+# .pyc files into __pycache__ on every run
+sys.dont_write_bytecode = True
+
+# Make job_card_extractor importable from the repository root, once per session.
+# Test modules import it at top level and do no path setup of their own.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
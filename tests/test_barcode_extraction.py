@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 import unittest
-import sys
-import os
 import numpy as np
+import cv2
 from unittest.mock import patch, MagicMock
 from PIL import Image
 
-# Add the parent directory to the path so we can import job_card_extractor
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The repository root is put on sys.path by conftest.py
 import job_card_extractor
 
 class TestBarcodeExtractionFunctions(unittest.TestCase):
@@ -25,6 +23,9 @@ class TestBarcodeExtractionFunctions(unittest.TestCase):
         # Test with empty string
         self.assertEqual(job_card_extractor.clean_barcode_value(""), "")
 
+        # Test with non-ASCII input (e.g. replacement characters from decoding)
+        self.assertEqual(job_card_extractor.clean_barcode_value("J12\ufffd34É5"), "J1234É5")
+
     @patch('job_card_extractor.decode')
     def test_detect_barcodes(self, mock_decode):
         """Test the detect_barcodes function with mocked barcode detection"""
@@ -53,51 +54,85 @@ class TestBarcodeExtractionFunctions(unittest.TestCase):
         args, kwargs = mock_decode.call_args
         self.assertIsInstance(args[0], Image.Image)
 
+    @patch('job_card_extractor.decode')
+    def test_detect_barcodes_grayscale(self, mock_decode):
+        """Test that grayscale crops are decoded directly as single-channel images"""
+        mock_barcode = MagicMock()
+        mock_barcode.type = "CODE128"
+        mock_barcode.data = b"J123456Q10"
+        mock_barcode.rect = (5, 5, 80, 20)
+        mock_decode.return_value = [mock_barcode]
+
+        img_crop = np.zeros((100, 200), dtype=np.uint8)
+
+        result, _ = job_card_extractor.detect_barcodes(img_crop)
+
+        self.assertEqual([r['barcode'] for r in result], ["J123456Q10"])
+        mock_decode.assert_called_once()
+        self.assertEqual(mock_decode.call_args[0][0].mode, 'L')
+
     @patch('cv2.cvtColor')
-    @patch('cv2.findContours')
+    @patch('cv2.connectedComponentsWithStats')
     @patch('cv2.adaptiveThreshold')
+    @patch('cv2.dilate')
     @patch('cv2.morphologyEx')
     @patch('cv2.getStructuringElement')
-    def test_detect_horizontal_lines(self, mock_get_struct, mock_morphology,
-                                   mock_threshold, mock_contours, mock_cvt_color):
+    @patch('cv2.resize')
+    def test_detect_horizontal_lines(self, mock_resize, mock_get_struct, mock_morphology, mock_dilate,
+                                   mock_threshold, mock_components, mock_cvt_color):
         """Test detect_horizontal_lines function with mocked OpenCV calls"""
         # Set up mocks
         mock_img = MagicMock()
         mock_img.shape = (800, 600, 3)  # height, width, channels
 
-        mock_cvt_color.return_value = np.zeros((800, 600), dtype=np.uint8)
-        mock_threshold.return_value = np.zeros((800, 600), dtype=np.uint8)
-        mock_morphology.return_value = np.zeros((800, 600), dtype=np.uint8)
-
-        # Mock contours to return sample lines at y=100, y=250, y=400
-        mock_cnt1 = MagicMock()
-        mock_cnt2 = MagicMock()
-        mock_cnt3 = MagicMock()
-        mock_cnt1.__getitem__.return_value = np.array([[[0, 100], [600, 100]]])
-        mock_cnt2.__getitem__.return_value = np.array([[[0, 250], [600, 250]]])
-        mock_cnt3.__getitem__.return_value = np.array([[[0, 400], [600, 400]]])
-
-        # Set up cv2.boundingRect returns for each contour
-        # Format: (x, y, width, height)
-        mock_contours.return_value = ([mock_cnt1, mock_cnt2, mock_cnt3], None)
-
-        with patch('cv2.boundingRect', side_effect=[
-            (0, 100, 600, 2),  # First contour rectangle
-            (0, 250, 600, 2),  # Second contour rectangle
-            (0, 400, 600, 2),  # Third contour rectangle
-        ]):
-            # Call the function
-            result = job_card_extractor.detect_horizontal_lines(mock_img)
-
-            # Verify the result includes the starting position, detected lines, and end position
-            self.assertEqual(result, [0, 100, 250, 400, 800])
-
-            # Verify the morphological kernel was created with expected dimensions
-            mock_get_struct.assert_called_once()
-            args, kwargs = mock_get_struct.call_args
-            # First arg should be MORPH_RECT
-            # Second and third args should be width and height of kernel
-            self.assertEqual(args[1], (120, 2))  # width = img_width / 5 = 600 / 5 = 120
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        # Detection runs on a quarter-scale copy of the page
+        mock_resize.return_value = np.zeros((200, 150, 3), dtype=np.uint8)
+        mock_cvt_color.return_value = np.zeros((200, 150), dtype=np.uint8)
+        mock_threshold.return_value = np.zeros((200, 150), dtype=np.uint8)
+        mock_morphology.return_value = np.zeros((200, 150), dtype=np.uint8)
+        mock_dilate.return_value = np.zeros((200, 150), dtype=np.uint8)
+
+        # Component stats rows in downsampled coordinates: (left, top, width, height, area);
+        # row 0 is the background. Lines at y=100, y=25 and y=63 are long enough,
+        # the one at y=75 is too short.
+        stats = np.array([
+            [0, 0, 150, 200, 30000],
+            [0, 100, 150, 1, 150],
+            [0, 25, 150, 1, 150],
+            [12, 75, 25, 1, 25],
+            [0, 63, 150, 1, 150],
+        ], dtype=np.int32)
+        mock_components.return_value = (5, None, stats, None)
+
+        # Call the function
+        result = job_card_extractor.detect_horizontal_lines(mock_img)
+
+        # Verify the result includes the starting position, the centres of the detected
+        # lines scaled back to page coordinates, and end position
+        self.assertEqual(result, [0, 102, 254, 402, 800])
+        self.assertEqual(mock_resize.call_args.args[1], (150, 200))
+
+        # Verify the morphological kernels were created with expected dimensions:
+        # a short segment kernel for a single opening pass, then a gap-bridging kernel
+        kernel_sizes = [c.args[1] for c in mock_get_struct.call_args_list]
+        self.assertEqual(kernel_sizes, [(10, 1), (7, 1)])  # bridge width = 600 / 80 = 7
+        self.assertEqual(mock_morphology.call_args.kwargs['iterations'], 1)
+        mock_dilate.assert_called_once()
+
+    def test_detect_horizontal_lines_position(self):
+        """Test that lines found on the downsampled page map back onto the drawn rules"""
+        # A4 page at 200 dpi with 1-3 px rules and a row of text between them
+        for thickness in (1, 2, 3):
+            page = np.full((2339, 1654, 3), 255, dtype=np.uint8)
+            rules = [620, 1001, 1700]
+            for y in rules:
+                page[y:y + thickness] = 0
+            cv2.putText(page, "Operation 10 CUTTING", (100, 900), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
+
+            result = job_card_extractor.detect_horizontal_lines(page)
+
+            self.assertEqual(result[0], 0)
+            self.assertEqual(result[-1], 2339)
+            self.assertEqual(len(result[1:-1]), len(rules))
+            for detected, y in zip(result[1:-1], rules):
+                self.assertLessEqual(abs(detected - y), 2, f"{thickness}px rule at y={y} detected at {detected}")
@@ -1,63 +1,148 @@
 #!/usr/bin/env python3
 import unittest
 import sys
-import os
 import json
 from unittest.mock import patch, MagicMock, mock_open
 
-# Add the parent directory to the path so we can import job_card_extractor
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The repository root is put on sys.path by conftest.py
 import job_card_extractor
 
 class TestJobExtractionFunctions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Static area fixtures, built once for the class; the extraction functions do not modify them
+        cls.JOB_NUMBER_CASES = [
+            # Test case 1: Job number in area with 'Job No' text
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Job No: 12345',
+                    'barcodes': [{'barcode': 'J12345'}, {'barcode': 'J67890'}]
+                },
+                {
+                    'page': 1,
+                    'area_index': 1,
+                    'ocr_text': 'Other info',
+                    'barcodes': [{'barcode': 'OTHER1'}]
+                }
+            ],
+            # Test case 2: No 'Job No' text but barcode on first page
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Some text',
+                    'barcodes': [{'barcode': 'J12345'}]
+                }
+            ],
+            # Test case 3: No barcodes on first page
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Job No: 12345',
+                    'barcodes': []
+                },
+                {
+                    'page': 2,
+                    'area_index': 0,
+                    'ocr_text': 'Some text',
+                    'barcodes': [{'barcode': 'J12345'}]
+                }
+            ],
+            # Test case 4: "Job No" area wins over an earlier area with a barcode
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Customer',
+                    'barcodes': [{'barcode': 'C0001'}]
+                },
+                {
+                    'page': 1,
+                    'area_index': 1,
+                    'ocr_text': 'Job No: 12345',
+                    'barcodes': [{'barcode': 'J12345'}]
+                }
+            ]
+        ]
+
+        cls.JOB_DETAILS_CASES = [
+            # Test case 1: Job details with all information present
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Job No: 12345',
+                    'barcodes': [{'barcode': 'J12345'}, {'barcode': 'J67890'}]
+                },
+                {
+                    'page': 1,
+                    'area_index': 1,
+                    'ocr_text': 'Quantity: 500',
+                    'barcodes': []
+                },
+                {
+                    'page': 1,
+                    'area_index': 2,
+                    'ocr_text': 'Delivery Date: 15/06/2025',
+                    'barcodes': []
+                },
+                {
+                    'page': 1,
+                    'area_index': 3,
+                    'ocr_text': 'Operation 10 CUTTING',
+                    'barcodes': [{'barcode': 'J12345Q10'}]
+                }
+            ],
+            # Test case 2: Job details with alternate format
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Some text',
+                    'barcodes': [{'barcode': 'J54321'}]
+                },
+                {
+                    'page': 1,
+                    'area_index': 1,
+                    'ocr_text': 'QTY: 250.00',
+                    'barcodes': []
+                },
+                {
+                    'page': 1,
+                    'area_index': 2,
+                    'ocr_text': 'Date Required: 10-May-2025',
+                    'barcodes': []
+                }
+            ],
+            # Test case 3: Missing quantity and delivery date
+            [
+                {
+                    'page': 1,
+                    'area_index': 0,
+                    'ocr_text': 'Job No: 12345',
+                    'barcodes': [{'barcode': 'J98765'}]
+                }
+            ]
+        ]
+
     def test_extract_job_number(self):
         """Test the job number extraction function with various inputs"""
         # Test case 1: Job number in area with 'Job No' text
-        test_data_1 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Job No: 12345',
-                'barcodes': [{'barcode': 'J12345'}, {'barcode': 'J67890'}]
-            },
-            {
-                'page': 1,
-                'area_index': 1,
-                'ocr_text': 'Other info',
-                'barcodes': [{'barcode': 'OTHER1'}]
-            }
-        ]
-        self.assertEqual(job_card_extractor.extract_job_number(test_data_1), 'J12345')
+        self.assertEqual(job_card_extractor.extract_job_number(self.JOB_NUMBER_CASES[0]), 'J12345')
 
         # Test case 2: No 'Job No' text but barcode on first page
-        test_data_2 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Some text',
-                'barcodes': [{'barcode': 'J12345'}]
-            }
-        ]
-        self.assertEqual(job_card_extractor.extract_job_number(test_data_2), 'J12345')
+        self.assertEqual(job_card_extractor.extract_job_number(self.JOB_NUMBER_CASES[1]), 'J12345')
 
         # Test case 3: No barcodes on first page
-        test_data_3 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Job No: 12345',
-                'barcodes': []
-            },
-            {
-                'page': 2,
-                'area_index': 0,
-                'ocr_text': 'Some text',
-                'barcodes': [{'barcode': 'J12345'}]
-            }
-        ]
-        self.assertEqual(job_card_extractor.extract_job_number(test_data_3), '')
+        self.assertEqual(job_card_extractor.extract_job_number(self.JOB_NUMBER_CASES[2]), '')
 
-        # Test case 4: Empty data
+        # Test case 4: "Job No" area wins over an earlier area with a barcode
+        self.assertEqual(job_card_extractor.extract_job_number(self.JOB_NUMBER_CASES[3]), 'J12345')
+
+        # Empty data
         self.assertEqual(job_card_extractor.extract_job_number([]), '')
 
     def test_clean_operation_name(self):
@@ -77,6 +162,16 @@ class TestJobExtractionFunctions(unittest.TestCase):
         self.assertEqual(job_card_extractor.clean_operation_name('Operation Name Scan'),
                         'Operation Name')
 
+    def test_starts_with_header_word(self):
+        """Test the header word prefix check used to skip non-operations"""
+        self.assertTrue(job_card_extractor._starts_with_header_word('Qty delivered so far'))
+        self.assertTrue(job_card_extractor._starts_with_header_word('TIME'))
+        self.assertTrue(job_card_extractor._starts_with_header_word('Entcr-Acttvity'))
+        # Header words must be whole words
+        self.assertFalse(job_card_extractor._starts_with_header_word('SOLDER JOINTS'))
+        self.assertFalse(job_card_extractor._starts_with_header_word('Timer_check'))
+        self.assertFalse(job_card_extractor._starts_with_header_word('3D PRINTING'))
+
     def test_extract_operations(self):
         """Test the operations extraction function"""
         # Test data with different operation formats
@@ -139,76 +234,38 @@ class TestJobExtractionFunctions(unittest.TestCase):
         self.assertEqual(result[2]['op_name'], 'WELDING')
         self.assertEqual(result[2]['op_id'], '')  # No barcode for this operation
 
+        # Op IDs built at runtime come back as the interned string
+        runtime_barcode = ''.join(['J12345', 'Q10'])
+        result = job_card_extractor.extract_operations([
+            {'page': 1, 'area_index': 0, 'ocr_text': 'Operation 10 CUTTING', 'barcodes': [{'barcode': runtime_barcode}]}
+        ])
+        self.assertIs(result[0]['op_id'], sys.intern('J12345Q10'))
+
+    def test_match_operation_patterns(self):
+        """Test that the joined regex pass never matches across area boundaries"""
+        # A bare number at the end of one area must not take the next area as its name
+        self.assertEqual(job_card_extractor._match_operation_patterns(['10', 'CUTTING']), [[], []])
+
+        matches = job_card_extractor._match_operation_patterns(['10\nWELDING', 'Operation 20 CUTTING'])
+        self.assertEqual([[m.groups() for _, m in area] for area in matches],
+                         [[('10', 'WELDING'), ('10', 'WELDING')], [('20', 'CUTTING')]])
+
     def test_extract_job_details(self):
         """Test the job details extraction function with various inputs"""
         # Test case 1: Job details with all information present
-        test_data_1 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Job No: 12345',
-                'barcodes': [{'barcode': 'J12345'}, {'barcode': 'J67890'}]
-            },
-            {
-                'page': 1,
-                'area_index': 1,
-                'ocr_text': 'Quantity: 500',
-                'barcodes': []
-            },
-            {
-                'page': 1,
-                'area_index': 2,
-                'ocr_text': 'Delivery Date: 15/06/2025',
-                'barcodes': []
-            },
-            {
-                'page': 1,
-                'area_index': 3,
-                'ocr_text': 'Operation 10 CUTTING',
-                'barcodes': [{'barcode': 'J12345Q10'}]
-            }
-        ]
-        result_1 = job_card_extractor.extract_job_details(test_data_1)
+        result_1 = job_card_extractor.extract_job_details(self.JOB_DETAILS_CASES[0])
         self.assertEqual(result_1['job_number'], 'J12345')
         self.assertEqual(result_1['quantity'], '500')
         self.assertEqual(result_1['delivery_date'], '15/06/2025')
 
         # Test case 2: Job details with alternate format
-        test_data_2 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Some text',
-                'barcodes': [{'barcode': 'J54321'}]
-            },
-            {
-                'page': 1,
-                'area_index': 1,
-                'ocr_text': 'QTY: 250.00',
-                'barcodes': []
-            },
-            {
-                'page': 1,
-                'area_index': 2,
-                'ocr_text': 'Date Required: 10-May-2025',
-                'barcodes': []
-            }
-        ]
-        result_2 = job_card_extractor.extract_job_details(test_data_2)
+        result_2 = job_card_extractor.extract_job_details(self.JOB_DETAILS_CASES[1])
         self.assertEqual(result_2['job_number'], 'J54321')
         self.assertEqual(result_2['quantity'], '250.00')
         self.assertEqual(result_2['delivery_date'], '10-May-2025')
 
         # Test case 3: Missing quantity and delivery date
-        test_data_3 = [
-            {
-                'page': 1,
-                'area_index': 0,
-                'ocr_text': 'Job No: 12345',
-                'barcodes': [{'barcode': 'J98765'}]
-            }
-        ]
-        result_3 = job_card_extractor.extract_job_details(test_data_3)
+        result_3 = job_card_extractor.extract_job_details(self.JOB_DETAILS_CASES[2])
         self.assertEqual(result_3['job_number'], 'J98765')
         self.assertEqual(result_3['quantity'], '')
         self.assertEqual(result_3['delivery_date'], '')
@@ -266,6 +323,3 @@ class TestJobExtractionFunctions(unittest.TestCase):
         self.assertEqual(empty_result['quantity'], '')
         self.assertEqual(empty_result['delivery_date'], '')
         self.assertEqual(len(empty_result['operations']), 0)
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 import unittest
-import sys
-import os
 import numpy as np
 import cv2  # Import cv2 at the module level
 from unittest.mock import patch, MagicMock
 
-# Add the parent directory to the path so we can import job_card_extractor
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The repository root is put on sys.path by conftest.py
 import job_card_extractor
 
+# Shared dummy images, locked read-only so no test can modify them for another
+_DUMMY_BGR = np.zeros((300, 400, 3), dtype=np.uint8)
+_DUMMY_GRAY = np.zeros((300, 400), dtype=np.uint8)
+_DUMMY_BGR.setflags(write=False)
+_DUMMY_GRAY.setflags(write=False)
+
 class TestOCRFunctions(unittest.TestCase):
+    def setUp(self):
+        # Cached readers and OCR results must not leak between tests
+        job_card_extractor._READER_CACHE.clear()
+        job_card_extractor._ocr_cache.clear()
+        self.addCleanup(job_card_extractor._READER_CACHE.clear)
+        self.addCleanup(job_card_extractor._ocr_cache.clear)
+
     @patch('cv2.bilateralFilter')
     @patch('cv2.createCLAHE')
     @patch('cv2.cvtColor')
@@ -20,34 +30,37 @@ class TestOCRFunctions(unittest.TestCase):
                                     mock_clahe_create, mock_bilateral):
         """Test the enhanced image preprocessing function for OCR"""
         # Create dummy image
-        crop = np.zeros((300, 400, 3), dtype=np.uint8)
+        crop = _DUMMY_BGR
 
         # Set up mocks to pass through the data
         mock_bilateral.return_value = crop
-        mock_cvtcolor.side_effect = [
-            np.zeros((300, 400), dtype=np.uint8),  # First call (to grayscale)
-            np.zeros((300, 400, 3), dtype=np.uint8)  # Second call (back to RGB)
-        ]
+        mock_cvtcolor.return_value = _DUMMY_GRAY  # To grayscale; the result stays single-channel
         
         # Mock CLAHE
         mock_clahe = MagicMock()
-        mock_clahe.apply.return_value = np.zeros((300, 400), dtype=np.uint8)
+        mock_clahe.apply.return_value = _DUMMY_GRAY
         mock_clahe_create.return_value = mock_clahe
         
-        mock_threshold.return_value = np.zeros((300, 400), dtype=np.uint8)
-        mock_resize.return_value = np.zeros((600, 800), dtype=np.uint8)
+        mock_threshold.return_value = np.zeros((100, 400), dtype=np.uint8)
+        mock_resize.return_value = np.zeros((200, 800), dtype=np.uint8)
 
         # Call function
         result = job_card_extractor.preprocess_image_for_ocr(crop)
 
         # Verify calls
         mock_bilateral.assert_called_once()
+        self.assertEqual(mock_bilateral.call_args[0][1:], (5, 40, 40))
+        self.assertEqual(mock_bilateral.call_args[0][0].ndim, 2)  # denoise the grayscale image
         mock_clahe_create.assert_called_once()
-        self.assertEqual(mock_cvtcolor.call_count, 2)
+        mock_cvtcolor.assert_called_once()
+        self.assertEqual(result.ndim, 2)
         mock_threshold.assert_called_once()
 
-        # Since height < 400, resize should be called
+        # Since height < 300, resize should be called, capped at 2x and using linear interpolation
         mock_resize.assert_called_once()
+        resize_kwargs = mock_resize.call_args[1]
+        self.assertEqual((resize_kwargs['fx'], resize_kwargs['fy']), (2.0, 2.0))
+        self.assertEqual(resize_kwargs['interpolation'], cv2.INTER_LINEAR)
 
     @patch('cv2.imencode')
     def test_perform_ocr(self, mock_imencode):
@@ -78,6 +91,56 @@ class TestOCRFunctions(unittest.TestCase):
         # Verify reader was called correctly with enhanced parameters
         mock_reader.readtext.assert_called_once_with(image, detail=True, paragraph=False)
 
+    def test_perform_ocr_batch(self):
+        """Test the batched OCR function groups images by shape and maps results back"""
+        mock_reader = MagicMock()
+        mock_reader.readtext_batched.return_value = [
+            [([(0, 0), (100, 0), (100, 20), (0, 20)], "Area_1", 0.9)],
+            [([(0, 0), (100, 0), (100, 20), (0, 20)], "Noise", 0.1),
+             ([(0, 25), (100, 25), (100, 45), (0, 45)], " Area 2 ", 0.8)]
+        ]
+        mock_reader.readtext.return_value = [([(0, 0), (100, 0), (100, 20), (0, 20)], "Area 3", 0.9)]
+
+        images = [
+            np.zeros((100, 200, 3), dtype=np.uint8),
+            None,
+            np.ones((150, 180, 3), dtype=np.uint8),
+            np.ones((100, 200, 3), dtype=np.uint8)
+        ]
+
+        result = job_card_extractor.perform_ocr_batch(mock_reader, images, use_cache=False)
+
+        self.assertEqual(result, ["Area 1", "", "Area 3", "Area 2"])
+
+        # Same-shaped images share one unpadded call; the odd one out is read on its own
+        mock_reader.readtext_batched.assert_called_once()
+        batch = mock_reader.readtext_batched.call_args[0][0]
+        self.assertEqual([image.shape for image in batch], [(100, 200, 3), (100, 200, 3)])
+        self.assertEqual(mock_reader.readtext_batched.call_args[1]['batch_size'], 2)
+        mock_reader.readtext.assert_called_once()
+        self.assertIs(mock_reader.readtext.call_args[0][0], images[2])
+
+        # The pixel budget splits a shape group across calls
+        mock_reader.reset_mock()
+        with patch.object(job_card_extractor, '_OCR_BATCH_MAX_PIXELS', 100 * 200):
+            result = job_card_extractor.perform_ocr_batch(mock_reader, [images[0], images[3]], use_cache=False)
+        self.assertEqual(result, ["Area 3", "Area 3"])
+        mock_reader.readtext_batched.assert_not_called()
+        self.assertEqual(mock_reader.readtext.call_count, 2)
+
+    @patch.object(job_card_extractor, '_ocr_cache_key', side_effect=ValueError("bad image"))
+    def test_perform_ocr_batch_bad_image(self, mock_cache_key):
+        """Test that an image the cache key cannot encode falls back to perform_ocr"""
+        mock_reader = MagicMock()
+        images = [np.zeros((100, 200, 3), dtype=np.uint8)]
+
+        with patch.object(job_card_extractor, 'perform_ocr', return_value="") as mock_perform_ocr:
+            result = job_card_extractor.perform_ocr_batch(mock_reader, images)
+
+        self.assertEqual(result, [""])
+        mock_perform_ocr.assert_called_once_with(mock_reader, images[0], use_cache=True)
+        mock_reader.readtext_batched.assert_not_called()
+
     @patch('cv2.rectangle')
     @patch('cv2.putText')
     def test_create_debug_image(self, mock_puttext, mock_rectangle):
@@ -100,80 +163,76 @@ class TestOCRFunctions(unittest.TestCase):
         # Verify result is an image with the correct shape
         self.assertEqual(result.shape, img_cv.shape)
 
-        # Verify drawing calls
-        # We expect 3 areas to be drawn (2 with enough height, 1 might be skipped due to height)
-        # plus 2 barcodes = 5 rectangle calls
-        self.assertEqual(mock_rectangle.call_count, 5)
+        # Rectangles are stamped directly into the array rather than drawn with cv2
+        mock_rectangle.assert_not_called()
+        np.testing.assert_array_equal(result[0, 200], (0, 0, 255))    # area top edge
+        np.testing.assert_array_equal(result[499, 200], (0, 0, 255))  # last area bottom edge
+        np.testing.assert_array_equal(result[60, 10], (0, 255, 0))    # barcode left edge
+        np.testing.assert_array_equal(result[60, 50], (0, 0, 0))      # barcode interior untouched
+        self.assertFalse(img_cv.any())  # the input image is not modified
 
         # 2 barcode annotations + 2 area text annotations
         self.assertEqual(mock_puttext.call_count, 4)
 
     @patch('job_card_extractor.detect_horizontal_lines')
-    @patch('job_card_extractor.detect_barcodes')
+    @patch('job_card_extractor.decode')
+    @patch('job_card_extractor._decode_enhanced')
     @patch('job_card_extractor.preprocess_image_for_ocr')
-    @patch('job_card_extractor.perform_ocr')
+    @patch('job_card_extractor.perform_ocr_batch')
     @patch('job_card_extractor.create_debug_image')
     @patch('cv2.cvtColor')
     @patch('cv2.adaptiveThreshold')
-    @patch('numpy.array')
-    @patch('job_card_extractor.easyocr.Reader')
-    def test_process_page(self, mock_easyocr_reader_class, mock_np_array, mock_threshold,
+    @patch('numpy.asarray')
+    def test_process_page(self, mock_np_array, mock_threshold,
                         mock_cvtcolor, mock_debug_img, mock_perform_ocr, mock_preprocess,
-                        mock_detect_barcodes, mock_detect_lines):
+                        mock_decode_enhanced, mock_decode, mock_detect_lines):
         """Test the page processing function"""
         # Set up mocks
         mock_img = MagicMock()
         mock_reader = MagicMock()
 
         # Configure mocks
-        mock_np_array.return_value = np.zeros((300, 400, 3), dtype=np.uint8)
+        mock_np_array.return_value = _DUMMY_BGR
 
         # Mock adaptiveThreshold
-        mock_threshold.return_value = np.zeros((300, 400), dtype=np.uint8)
+        mock_threshold.return_value = _DUMMY_GRAY
 
         # Setup cvtColor to return appropriate values for color conversions
         def cvt_color_side_effect(image, conversion_code):
-            if conversion_code == cv2.COLOR_BGR2GRAY:
-                return np.zeros((300, 400), dtype=np.uint8)  # Return grayscale
+            if conversion_code in (cv2.COLOR_RGB2GRAY, cv2.COLOR_BGR2GRAY):
+                return _DUMMY_GRAY  # Return grayscale
             else:
-                return np.zeros((300, 400, 3), dtype=np.uint8)  # Return RGB
+                return _DUMMY_BGR  # Return RGB
 
         mock_cvtcolor.side_effect = cvt_color_side_effect
 
         mock_detect_lines.return_value = [0, 100, 300]  # 2 areas
 
-        # Mock barcode detection
-        mock_barcode = {
-            'type': 'CODE39',
-            'barcode': 'J12345',
-            'rect': [10, 20, 100, 30]
-        }
-
-        # Create proper mock barcode object with rect property
+        # Mock barcode detection: one full-page decode finds a barcode in the first
+        # area (x, y, w, h in page coordinates) and one in the second
         mock_barcode_object = MagicMock()
-        mock_barcode_object.rect = (10, 20, 100, 30)  # Tuple with x, y, w, h
+        mock_barcode_object.rect = (10, 20, 100, 30)
         mock_barcode_object.data = b"J12345"
         mock_barcode_object.type = "CODE39"
+        mock_barcode_object.quality = 1
 
-        mock_detect_barcodes.side_effect = [
-            ([mock_barcode], [mock_barcode_object]),  # First area
-            ([], [])                          # Second area
-        ]
+        mock_barcode_object_2 = MagicMock()
+        mock_barcode_object_2.rect = (10, 150, 100, 30)
+        mock_barcode_object_2.data = b"J12345Q10"
+        mock_barcode_object_2.type = "CODE128"
+        mock_barcode_object_2.quality = 1
+
+        mock_decode.return_value = [mock_barcode_object_2, mock_barcode_object]
 
         # Mock OCR text extraction
-        mock_preprocess.return_value = np.zeros((300, 400, 3), dtype=np.uint8)
-        mock_perform_ocr.side_effect = [
+        mock_preprocess.return_value = _DUMMY_BGR
+        mock_perform_ocr.return_value = [
             "Area 1 Text",   # First area
             "Area 2 Text"    # Second area
         ]
 
         # Mock debug image creation
-        mock_debug_img.return_value = np.zeros((300, 400, 3), dtype=np.uint8)
-
-        # Mock EasyOCR for preview
-        mock_easyocr_instance = MagicMock()
-        mock_easyocr_instance.readtext.return_value = ["OCR preview text"]
-        mock_easyocr_reader_class.return_value = mock_easyocr_instance
+        mock_debug_img.return_value = _DUMMY_BGR
 
         # Call function
         result_areas, result_debug_img = job_card_extractor.process_page(0, mock_img, mock_reader)
@@ -187,8 +246,22 @@ class TestOCRFunctions(unittest.TestCase):
         self.assertEqual(len(result_areas[0]['barcodes']), 1)
         self.assertEqual(result_areas[0]['barcodes'][0]['barcode'], "J12345")
 
-        # Verify the second area has no barcodes
-        self.assertEqual(len(result_areas[1]['barcodes']), 0)
+        # Barcodes were assigned by position, with rects relative to their area
+        self.assertEqual(result_areas[1]['barcodes'][0]['barcode'], "J12345Q10")
+        self.assertEqual(result_areas[1]['barcodes'][0]['rect'], [10, 50, 100, 30])
+
+        # The page was decoded once, with no per-area retries needed
+        mock_decode.assert_called_once()
+        mock_decode_enhanced.assert_not_called()
+
+        # Verify all areas were OCR'd in a single batched call
+        mock_perform_ocr.assert_called_once()
+        self.assertEqual(len(mock_perform_ocr.call_args[0][1]), 2)
+
+        # The RGB page goes straight to grayscale; BGR is only made for the debug image
+        conversions = [c.args[1] for c in mock_cvtcolor.call_args_list]
+        self.assertEqual(conversions, [cv2.COLOR_RGB2GRAY, cv2.COLOR_RGB2BGR])
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        # OCR preprocessing works on slices of the page grayscale
+        preprocessed_shapes = [c.args[0].shape for c in mock_preprocess.call_args_list]
+        self.assertEqual(preprocessed_shapes, [(100, 400), (200, 400)])
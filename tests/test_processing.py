@@ -1,185 +1,322 @@
 #!/usr/bin/env python3
-import unittest
 import sys
 import os
 import json
 import argparse
-import tempfile
+import io
+import copy
+import cv2
+import pytest
+import threading
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, call
 
-# Add the parent directory to the path so we can import job_card_extractor
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The repository root is put on sys.path by conftest.py
 import job_card_extractor
 
-class TestProcessingFunctions(unittest.TestCase):
-    @patch('os.path.exists')
-    @patch('job_card_extractor.extract_areas_from_pdf')
-    @patch('job_card_extractor.extract_job_and_operations')
-    def test_process_pdf_document(self, mock_extract_job, mock_extract_areas, mock_exists):
-        """Test the main PDF processing function"""
-        # Mock file existence check
-        mock_exists.return_value = True
-        
-        # Mock the extraction functions
-        mock_areas_result = ([{'page': 1, 'ocr_text': 'test'}], [MagicMock()])
-        mock_extract_areas.return_value = mock_areas_result
-
-        mock_job_result = {'job_number': 'J12345', 'operations': [{'op_number': '10', 'op_name': 'TEST'}]}
-        mock_extract_job.return_value = mock_job_result
-
-        # Test with output directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock open and json.dump for this test case
-            with patch('builtins.open', new_callable=mock_open) as mock_open_file, \
-                 patch('os.makedirs') as mock_makedirs, \
-                 patch('json.dump') as mock_json_dump:
-
-                # Call the function with enhanced parameters
-                result = job_card_extractor.process_pdf_document(
-                    'test.pdf',
-                    output_dir=temp_dir,
-                    lang_list=['en'],
-                    save_raw=True,
-                    save_annotated=True,
-                    parallel_processing=False,
-                    enhance_quality=True
-                )
-
-                # Verify results
-                self.assertEqual(result, mock_job_result)
-
-                # Verify directory creation
-                mock_makedirs.assert_called()
-
-                # Verify file operations (raw and clean outputs)
-                self.assertEqual(mock_open_file.call_count, 2)
-
-                # Verify JSON dumps
-                self.assertEqual(mock_json_dump.call_count, 2)
-
-                # Verify first call to extract_areas_from_pdf with enhanced parameters
-                mock_extract_areas.assert_called_with(
-                    'test.pdf',
-                    lang_list=['en'],
-                    output_dir=os.path.join(temp_dir, "annotated"),
-                    parallel_processing=False,
-                    enhance_quality=True
-                )
-
-        # Test without output directory - with fresh mocks
-        mock_extract_areas.reset_mock()
-        mock_extract_job.reset_mock()
-
-        # Use a separate patch for this test case
-        with patch('builtins.open', new_callable=mock_open) as mock_open_file_2:
-            result = job_card_extractor.process_pdf_document(
-                'test.pdf',
-                output_dir=None
-            )
+# Parsed command line arguments for main(), as argparse would produce them with no flags
+_MAIN_ARGS = SimpleNamespace(
+    pdf_files=[],
+    output_dir=None,
+    lang=['en'],
+    raw=False,
+    no_raw=True,
+    no_annotated=False,
+    parallel=False,
+    no_parallel=True,
+    fast_mode=False,
+    workers=1,
+    version=False,
+)
+
+def _main_args(**overrides):
+    """Return a copy of _MAIN_ARGS with the given attributes overridden."""
+    args = copy.copy(_MAIN_ARGS)
+    vars(args).update(overrides)
+    return args
+
+@pytest.fixture(autouse=True)
+def empty_reader_cache(monkeypatch):
+    """OCR readers are cached per language set; run each test without one."""
+    monkeypatch.setattr(job_card_extractor, '_READER_CACHE', {})
+
+@pytest.fixture(scope="module")
+def shared_pdf_mocks():
+    """EasyOCR Reader class and process_page mocks, built once for the module."""
+    return SimpleNamespace(
+        reader_class=MagicMock(),
+        process_page=MagicMock(spec=job_card_extractor.process_page),
+    )
+
+@pytest.fixture
+def pdf_mocks(shared_pdf_mocks, monkeypatch):
+    """Install the shared mocks with their calls, return values and side effects cleared."""
+    for mock in vars(shared_pdf_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    # A stand-in easyocr module, so _get_reader never imports the real one (and torch)
+    monkeypatch.setitem(sys.modules, 'easyocr', SimpleNamespace(Reader=shared_pdf_mocks.reader_class))
+    monkeypatch.setattr(job_card_extractor, 'process_page', shared_pdf_mocks.process_page)
+    return shared_pdf_mocks
+
+@pytest.fixture
+def pdf_env(pdf_mocks, monkeypatch):
+    """pdf_mocks plus mocked PDF rendering, file checks and debug image writes for extract_areas_from_pdf."""
+    env = SimpleNamespace(
+        reader_class=pdf_mocks.reader_class,
+        process_page=pdf_mocks.process_page,
+        pdfinfo=MagicMock(),
+        convert=MagicMock(),
+        imwrite=MagicMock(),
+        makedirs=MagicMock(),
+    )
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(job_card_extractor, 'pdfinfo_from_path', env.pdfinfo)
+    monkeypatch.setattr(job_card_extractor, 'convert_from_path', env.convert)
+    monkeypatch.setattr(cv2, 'imwrite', env.imwrite)
+    monkeypatch.setattr(os, 'makedirs', env.makedirs)
+    return env
+
+class _FakeFile(io.StringIO):
+    """In-memory text file that hands its contents to the fake filesystem when closed."""
+
+    def __init__(self, fs, path):
+        super().__init__()
+        self._fs = fs
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._fs.files[self._path] = self.getvalue()
+        super().close()
+
+class _FakeFS:
+    """Stand-in for the open() and os.makedirs() calls made when saving outputs."""
+
+    def __init__(self):
+        self.files = {}  # path -> text written, in the order the files were closed
+        self.opened = []
+        self.makedirs_calls = []
+
+    def open(self, path, mode='r', encoding=None):
+        self.opened.append(path)
+        return _FakeFile(self, path)
+
+    def makedirs(self, path, exist_ok=False):
+        self.makedirs_calls.append(path)
+
+# Canned results of the extraction steps called by process_pdf_document
+_AREAS_RESULT = ([{'page': 1, 'ocr_text': 'test'}], ['page_1_areas.jpg'])
+_JOB_RESULT = {'job_number': 'J12345', 'operations': [{'op_number': '10', 'op_name': 'TEST'}]}
+
+@pytest.fixture
+def document_mocks(monkeypatch):
+    """Fresh mocks for the extraction steps of process_pdf_document, returning copies of the canned results."""
+    mocks = SimpleNamespace(
+        extract_areas=MagicMock(return_value=copy.deepcopy(_AREAS_RESULT)),
+        extract_job=MagicMock(return_value=copy.deepcopy(_JOB_RESULT)),
+        pdfinfo=MagicMock(return_value={'Pages': 3}),
+    )
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(job_card_extractor, 'pdfinfo_from_path', mocks.pdfinfo)
+    monkeypatch.setattr(job_card_extractor, 'extract_areas_from_pdf', mocks.extract_areas)
+    monkeypatch.setattr(job_card_extractor, 'extract_job_and_operations', mocks.extract_job)
+    return mocks
+
+@pytest.fixture(scope="session")
+def session_output_dir(tmp_path_factory):
+    """Output directory created once per session; only extraction log files are really written to it."""
+    return str(tmp_path_factory.mktemp("jce_output"))
+
+@pytest.fixture
+def fake_fs(monkeypatch):
+    """Route job_card_extractor's open() and os.makedirs() to an in-memory filesystem."""
+    fs = _FakeFS()
+    # A module global named open shadows the builtin for job_card_extractor only
+    monkeypatch.setattr(job_card_extractor, 'open', fs.open, raising=False)
+    monkeypatch.setattr(os, 'makedirs', fs.makedirs)
+    return fs
+
+def test_main_function_with_version_flag():
+    """Test the main function with version flag"""
+    with patch('sys.exit', side_effect=SystemExit) as mock_exit, \
+         patch('job_card_extractor.display_version') as mock_display_version, \
+         patch('sys.argv', ['job_card_extractor.py', '--version']):
+
+        with pytest.raises(SystemExit):
+            job_card_extractor.main()
 
-            # Verify results without output dir
-            self.assertEqual(result, mock_job_result)
-            # No files should be opened when output_dir is None
-            mock_open_file_2.assert_not_called()
-
-    def test_main_function_with_version_flag(self):
-        """Test the main function with version flag"""
-        # Define a test function that mimics main() but is isolated for this test
-        def isolated_main():
-            parser = argparse.ArgumentParser(
-                description="Process PDF job documents and extract job number and operations"
-            )
-            parser.add_argument(
-                "pdf_files",
-                nargs='*',
-                help="Path to the PDF file(s) to process"
-            )
-            parser.add_argument(
-                "-v", "--version",
-                action="store_true",
-                help="Display version information"
-            )
-            # Add other arguments
-            parser.add_argument("-o", "--output-dir", help="Directory to save output files")
-            parser.add_argument("-l", "--lang", nargs='+', default=['en'], help="Language codes for OCR")
-            parser.add_argument("--no-raw", action="store_true", help="Don't save raw extraction data")
-            parser.add_argument("--no-annotated", action="store_true", help="Don't save annotated debug images")
+        # Verify version was displayed and exit was called
+        mock_display_version.assert_called_once()
+        mock_exit.assert_called_once_with(0)
 
-            args = parser.parse_args()
+def test_main_function_with_no_files():
+    """Test the main function with no PDF files provided"""
+    with patch('argparse.ArgumentParser.parse_args') as mock_parse_args, \
+         patch('sys.exit') as mock_exit:
 
-            if args.version:
-                job_card_extractor.display_version()
-                sys.exit(0)
+        mock_parse_args.return_value = _main_args()
 
-            # Rest of function not needed for this test
+        # Call main function
+        job_card_extractor.main()
 
-        # Now patch sys.exit and display_version for our isolated function
-        with patch('sys.exit') as mock_exit, \
-             patch('job_card_extractor.display_version') as mock_display_version, \
-             patch('sys.argv', ['job_card_extractor.py', '--version']):
+        # Verify exit was called with error
+        mock_exit.assert_called_once_with(1)
 
-            # Call our isolated function
-            isolated_main()
+def test_main_function_with_workers():
+    """Test the main function distributes PDFs across worker processes"""
+    with patch('argparse.ArgumentParser.parse_args') as mock_parse_args, \
+         patch('job_card_extractor.ProcessPoolExecutor') as mock_pool_class, \
+         patch('os.cpu_count', return_value=12):
 
-            # Verify version was displayed and exit was called
-            mock_display_version.assert_called_once()
-            mock_exit.assert_called_once_with(0)
+        mock_parse_args.return_value = _main_args(
+            pdf_files=['test1.pdf', 'test2.pdf', 'test3.pdf'],
+            output_dir='output',
+            fast_mode=True,
+            workers=8
+        )
 
-    def test_main_function_with_no_files(self):
-        """Test the main function with no PDF files provided"""
-        with patch('argparse.ArgumentParser.parse_args') as mock_parse_args, \
-             patch('sys.exit') as mock_exit:
+        mock_executor = mock_pool_class.return_value.__enter__.return_value
+        mock_executor.submit.return_value.result.return_value = {'job_number': 'J12345', 'operations': []}
 
-            mock_args = MagicMock()
-            mock_args.version = False
-            mock_args.pdf_files = []
-            mock_parse_args.return_value = mock_args
+        # Call main function
+        job_card_extractor.main()
 
-            # Call main function
-            job_card_extractor.main()
+        # Pool size is capped by the number of PDFs, cores are split between workers,
+        # and there is one task per PDF
+        mock_pool_class.assert_called_once_with(
+            max_workers=3,
+            initializer=job_card_extractor._init_pdf_worker,
+            initargs=(['en'], 4)
+        )
+        assert mock_executor.submit.call_count == 3
+        mock_executor.submit.assert_any_call(
+            job_card_extractor.process_pdf_document,
+            'test2.pdf',
+            output_dir='output',
+            lang_list=['en'],
+            save_raw=False,
+            save_annotated=True,
+            parallel_processing=False,
+            enhance_quality=False
+        )
 
-            # Verify exit was called with error
-            mock_exit.assert_called_once_with(1)
-
-    def test_main_function_with_pdf_files(self):
-        """Test the main function with PDF files provided"""
-        with patch('argparse.ArgumentParser.parse_args') as mock_parse_args, \
-             patch('job_card_extractor.process_pdf_document') as mock_process:
-
-            mock_args = MagicMock()
-            mock_args.pdf_files = ['test1.pdf', 'test2.pdf']
-            mock_args.output_dir = 'output'
-            mock_args.lang = ['en']
-            mock_args.no_raw = False
-            mock_args.no_annotated = True
-            mock_args.no_parallel = False
-            mock_args.fast_mode = False
-            mock_args.version = False
-            mock_parse_args.return_value = mock_args
-
-            # Mock process_pdf_document to return a result
-            mock_process.return_value = {'job_number': 'J12345', 'operations': []}
-
-            # Call main function
-            job_card_extractor.main()
+@patch('job_card_extractor._get_reader')
+@patch('cv2.setNumThreads')
+def test_init_pdf_worker(mock_set_threads, mock_get_reader, capsys):
+    """Test worker initialization limits native threads and preloads the reader"""
+    # A stand-in torch keeps the real one out of the test process
+    mock_torch = MagicMock()
+    with patch.dict(sys.modules, {'torch': mock_torch}):
+        job_card_extractor._init_pdf_worker(['en', 'fr'], 2)
+
+        mock_set_threads.assert_called_once_with(2)
+        mock_torch.set_num_threads.assert_called_once_with(2)
+        mock_get_reader.assert_called_once_with(['en', 'fr'])
+
+        # A reader that fails to load only produces a warning
+        mock_get_reader.side_effect = RuntimeError("no models")
+        job_card_extractor._init_pdf_worker(['en'], 1)
+
+    assert "Warning: Could not preload OCR reader" in capsys.readouterr().out
+
+@patch('os.path.exists')
+@patch('job_card_extractor.pdfinfo_from_path')
+@patch('job_card_extractor.convert_from_path')
+@patch('job_card_extractor._get_reader')
+@patch('job_card_extractor._prepare_page')
+@patch('job_card_extractor._recognize_pages')
+def test_extract_areas_from_pdf_pipelined(mock_recognize, mock_prepare, mock_get_reader,
+                                         mock_convert, mock_pdfinfo, mock_exists):
+    """Test the pipelined (parallel) PDF to areas extraction path"""
+    mock_exists.return_value = True
+    mock_pdfinfo.return_value = {'Pages': 3}
+
+    # Pages are rendered in chunks
+    pages = [MagicMock(), MagicMock(), MagicMock()]
+    mock_convert.side_effect = lambda path, first_page, last_page, thread_count: pages[first_page - 1:last_page]
+
+    # Prepared pages carry their page number through to recognition
+    mock_prepare.side_effect = lambda page_num, img, **kwargs: {'page_num': page_num, 'crops_for_ocr': []}
+    mock_recognize.side_effect = lambda prepared_pages, reader: [
+        ([{'page': prepared['page_num'] + 1, 'area_index': 0}], None)
+        for prepared in prepared_pages
+    ]
+
+    areas, debug_images = job_card_extractor.extract_areas_from_pdf('test.pdf', parallel_processing=True)
+
+    # Pages come back in order, rendered as one chunk
+    assert [area['page'] for area in areas] == [1, 2, 3]
+    assert debug_images == []
+    mock_convert.assert_called_once()
+    assert mock_convert.call_args.kwargs['first_page'] == 1
+    assert mock_convert.call_args.kwargs['last_page'] == 3
+    assert [c.args[1] for c in mock_prepare.call_args_list] == pages
+
+@patch('job_card_extractor.convert_from_path')
+@patch('job_card_extractor._prepare_page')
+@patch('job_card_extractor._recognize_pages')
+def test_run_page_pipeline_stops_threads_on_close(mock_recognize, mock_prepare, mock_convert):
+    """Test that closing the pipeline early stops the producer threads"""
+    # More pages than the queues can hold, so both producers would block on a full queue
+    pages = [MagicMock() for _ in range(20)]
+    mock_convert.side_effect = lambda path, first_page, last_page, thread_count: pages[first_page - 1:last_page]
+    # Each page's crops fill the OCR pixel budget, so pages are recognised one at a time
+    crop = SimpleNamespace(shape=(10, 10))
+    mock_prepare.side_effect = lambda page_num, img, **kwargs: {'page_num': page_num, 'crops_for_ocr': [crop]}
+    mock_recognize.side_effect = lambda prepared_pages, reader: [([], None) for _ in prepared_pages]
+
+    with patch.object(job_card_extractor, '_OCR_BATCH_MAX_PIXELS', 100):
+        pipeline = job_card_extractor._run_page_pipeline('test.pdf', len(pages), MagicMock())
+        next(pipeline)
+        pipeline.close()
+
+    live = [t.name for t in threading.enumerate() if t.name in ('pdf-render', 'page-prepare')]
+    assert live == []
+    assert mock_prepare.call_count < len(pages)
+
+@patch('job_card_extractor.convert_from_path')
+def test_iter_pdf_pages(mock_convert):
+    """Test that PDF pages are rendered lazily in chunks"""
+    mock_convert.side_effect = lambda path, first_page, last_page, thread_count: [
+        f"page{n}" for n in range(first_page, last_page + 1)
+    ]
+
+    pages = list(job_card_extractor._iter_pdf_pages('test.pdf', 5, chunk_size=2))
+
+    assert pages == [(0, 'page1'), (1, 'page2'), (2, 'page3'), (3, 'page4'), (4, 'page5')]
+    assert [(c.kwargs['first_page'], c.kwargs['last_page']) for c in mock_convert.call_args_list] == [
+        (1, 2), (3, 4), (5, 5)
+    ]
+
+@pytest.mark.parametrize("pdf_files", [
+    ['test1.pdf'],
+    ['test1.pdf', 'test2.pdf'],
+    [f'test{n}.pdf' for n in range(1, 11)],
+], ids=['one_pdf', 'two_pdfs', 'ten_pdfs'])
+def test_main_function_with_pdf_files(pdf_files):
+    """Test the main function with PDF files provided"""
+    with patch('argparse.ArgumentParser.parse_args') as mock_parse_args, \
+         patch('job_card_extractor.process_pdf_document') as mock_process:
+
+        mock_parse_args.return_value = _main_args(
+            pdf_files=pdf_files,
+            output_dir='output',
+            no_raw=False,
+            no_annotated=True,
+            no_parallel=False
+        )
 
-            # Verify process_pdf_document was called for each PDF file
-            self.assertEqual(mock_process.call_count, 2)
-            
-            # Verify calls with correct arguments including new parameters
-            mock_process.assert_any_call(
-                'test1.pdf',
-                output_dir='output',
-                lang_list=['en'],
-                save_raw=True,
-                save_annotated=False,
-                parallel_processing=True,
-                enhance_quality=True
-            )
+        # Mock process_pdf_document to return a result
+        mock_process.return_value = {'job_number': 'J12345', 'operations': []}
+
+        # Call main function
+        job_card_extractor.main()
 
-            mock_process.assert_any_call(
-                'test2.pdf',
+        # One call per PDF, in order, with the settings derived from the flags
+        assert mock_process.call_args_list == [
+            call(
+                pdf_file,
                 output_dir='output',
                 lang_list=['en'],
                 save_raw=True,
@@ -187,62 +324,117 @@ class TestProcessingFunctions(unittest.TestCase):
                 parallel_processing=True,
                 enhance_quality=True
             )
-
-    @patch('os.path.exists')
-    @patch('job_card_extractor.convert_from_path')
-    @patch('job_card_extractor.easyocr.Reader')
-    @patch('job_card_extractor.process_page')
-    @patch('cv2.imwrite')
-    @patch('os.makedirs')
-    def test_extract_areas_from_pdf(self, mock_makedirs, mock_imwrite, mock_process_page,
-                                 mock_reader, mock_convert, mock_exists):
-        """Test the PDF to areas extraction function"""
-        # Set up mocks
-        mock_exists.return_value = True
-
-        # Mock PDF to image conversion
-        page1 = MagicMock()
-        page2 = MagicMock()
-        mock_convert.return_value = [page1, page2]
-
-        # Mock EasyOCR reader
-        mock_reader_instance = MagicMock()
-        mock_reader.return_value = mock_reader_instance
-
-        # Mock process_page results
-        page1_areas = [{'page': 1, 'area_index': 0}]
-        page1_debug = MagicMock()
-
-        page2_areas = [{'page': 2, 'area_index': 0}, {'page': 2, 'area_index': 1}]
-        page2_debug = MagicMock()
-
-        mock_process_page.side_effect = [
-            (page1_areas, page1_debug),
-            (page2_areas, page2_debug)
+            for pdf_file in pdf_files
         ]
 
-        # Call the function
-        areas, debug_images = job_card_extractor.extract_areas_from_pdf(
-            'test.pdf',
-            lang_list=['en', 'fr'],
-            output_dir='output/debug'
-        )
-
-        # Verify results
-        self.assertEqual(len(areas), 3)  # 1 from page1 + 2 from page2
-        self.assertEqual(len(debug_images), 2)  # 2 pages
-
-        # Verify process_page calls
-        self.assertEqual(mock_process_page.call_count, 2)
-
-        # Verify output directory creation and image saving
-        mock_makedirs.assert_called_once_with('output/debug', exist_ok=True)
-        self.assertEqual(mock_imwrite.call_count, 2)
-
-        # Test FileNotFoundError handling
-        mock_exists.return_value = False
-        with self.assertRaises(FileNotFoundError):
-            job_card_extractor.extract_areas_from_pdf('notfound.pdf')
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+def test_process_pdf_document_with_output_dir(document_mocks, fake_fs, session_output_dir):
+    """Test the main PDF processing function saving its outputs"""
+    job_result = document_mocks.extract_job.return_value
+    output_dir = session_output_dir
+
+    # Call the function with enhanced parameters
+    result = job_card_extractor.process_pdf_document(
+        'test.pdf',
+        output_dir=output_dir,
+        lang_list=['en'],
+        save_raw=True,
+        save_annotated=True,
+        parallel_processing=False,
+        enhance_quality=True
+    )
+
+    # Verify results
+    assert result == job_result
+
+    # The page count comes from the PDF, even though only page 1 produced areas
+    assert result['extraction_metadata']['document_info']['total_pages'] == 3
+
+    # Verify directory creation
+    assert output_dir in fake_fs.makedirs_calls
+    assert os.path.join(output_dir, "annotated") in fake_fs.makedirs_calls
+
+    # Verify the raw and clean outputs went through the real json.dump
+    raw_json_path = os.path.join(output_dir, 'test_raw.json')
+    clean_json_path = os.path.join(output_dir, 'test_job_and_operations.json')
+    assert list(fake_fs.files) == [raw_json_path, clean_json_path]
+    assert json.loads(fake_fs.files[raw_json_path]) == _AREAS_RESULT[0]
+    assert json.loads(fake_fs.files[clean_json_path]) == job_result
+
+    # Verify the call to extract_areas_from_pdf with enhanced parameters
+    document_mocks.extract_areas.assert_called_once_with(
+        'test.pdf',
+        lang_list=['en'],
+        output_dir=os.path.join(output_dir, "annotated"),
+        parallel_processing=False,
+        enhance_quality=True
+    )
+
+def test_process_pdf_document_without_output_dir(document_mocks, fake_fs):
+    """Test the main PDF processing function without an output directory"""
+    result = job_card_extractor.process_pdf_document(
+        'test.pdf',
+        output_dir=None
+    )
+
+    # Verify results without output dir
+    assert result == document_mocks.extract_job.return_value
+    # No files should be opened or directories created when output_dir is None
+    assert fake_fs.opened == []
+    assert fake_fs.makedirs_calls == []
+
+def test_extract_areas_from_pdf(pdf_env):
+    """Test the PDF to areas extraction function"""
+    # Mock PDF to image conversion
+    pdf_env.pdfinfo.return_value = {'Pages': 2}
+    page1 = MagicMock()
+    page2 = MagicMock()
+    pdf_env.convert.return_value = [page1, page2]
+
+    # Mock EasyOCR reader
+    mock_reader_instance = MagicMock()
+    pdf_env.reader_class.return_value = mock_reader_instance
+
+    # Mock process_page results
+    page1_areas = [{'page': 1, 'area_index': 0}]
+    page1_debug = MagicMock()
+
+    page2_areas = [{'page': 2, 'area_index': 0}, {'page': 2, 'area_index': 1}]
+    page2_debug = MagicMock()
+
+    page_results = iter([
+        (page1_areas, page1_debug),
+        (page2_areas, page2_debug)
+    ])
+    pdf_env.process_page.side_effect = lambda *args, **kwargs: next(page_results)
+
+    # Call the function
+    areas, debug_images = job_card_extractor.extract_areas_from_pdf(
+        'test.pdf',
+        lang_list=['en', 'fr'],
+        output_dir='output/debug',
+        parallel_processing=False
+    )
+
+    # Verify results
+    assert len(areas) == 3  # 1 from page1 + 2 from page2
+    assert debug_images == [os.path.join('output/debug', 'page_1_areas.jpg'),
+                            os.path.join('output/debug', 'page_2_areas.jpg')]
+
+    # Verify process_page calls
+    assert pdf_env.process_page.call_count == 2
+
+    # Verify the reader was created once and cached for the language set
+    pdf_env.reader_class.assert_called_once_with(['en', 'fr'])
+    assert job_card_extractor._READER_CACHE[('en', 'fr')] is mock_reader_instance
+
+    # Verify output directory creation and image saving
+    pdf_env.makedirs.assert_called_once_with('output/debug', exist_ok=True)
+    assert pdf_env.imwrite.call_count == 2
+    pdf_env.imwrite.assert_any_call(os.path.join('output/debug', 'page_2_areas.jpg'), page2_debug,
+                                    [cv2.IMWRITE_JPEG_QUALITY, 75, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+
+def test_extract_areas_from_pdf_missing_file(monkeypatch):
+    """Test that a missing PDF raises FileNotFoundError before any rendering or OCR"""
+    monkeypatch.setattr(os.path, 'exists', lambda path: False)
+    with pytest.raises(FileNotFoundError):
+        job_card_extractor.extract_areas_from_pdf('notfound.pdf')
@@ -1,35 +1,29 @@
 #!/usr/bin/env python3
-import unittest
 import sys
-import os
-import io
-from unittest.mock import patch
+import re
+import pytest
 
-# Add the parent directory to the path so we can import job_card_extractor
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from job_card_extractor import get_version, display_version, __version__
+# The repository root is put on sys.path by conftest.py
+import job_card_extractor
 
-class TestVersionFunctions(unittest.TestCase):
-    def test_get_version(self):
-        """Test that get_version returns the correct version string"""
-        self.assertEqual(get_version(), __version__)
-        self.assertIsInstance(get_version(), str)
+# Expected display_version output, in print order
+_VERSION_RE = re.compile(r"Job Card Extractor v" + re.escape(job_card_extractor.__version__) + r".*Montimage.*documentation",
+                         re.DOTALL)
 
-    def test_display_version(self):
-        """Test that display_version prints the correct version information"""
-        # Redirect stdout to capture printed output
-        captured_output = io.StringIO()
-        with patch('sys.stdout', new=captured_output):
-            display_version()
+def test_get_version():
+    """Test that get_version returns the correct version string"""
+    assert job_card_extractor.get_version() == job_card_extractor.__version__
+    assert isinstance(job_card_extractor.get_version(), str)
 
-        # Get the printed output
-        output = captured_output.getvalue()
+def test_display_version(capsys):
+    """Test that display_version prints the correct version information"""
+    job_card_extractor.display_version()
 
-        # Check that the output contains the version number
-        self.assertIn(f"Job Card Extractor v{__version__}", output)
-        # Check that the output contains other expected information
-        self.assertIn("Montimage", output)
-        self.assertIn("documentation", output)
+    # Get the printed output
+    output = capsys.readouterr().out
+
+    # Check for the version number, then the other expected information, in one scan
+    assert _VERSION_RE.search(output)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))